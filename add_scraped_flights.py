@@ -9,7 +9,9 @@ This script scrapes real-time flight data and adds it to the existing database.
 import sys
 import os
 from datetime import datetime, timedelta
-import random
+import numpy as np
+import pandas as pd
+from sqlalchemy import delete, func, select
 
 # Add current directory to path for imports
 sys.path.append(os.path.dirname(__file__))
@@ -18,14 +20,17 @@ from final_flight_scraper import FlightScraper
 from app import app
 from models import db, Flight, Airport, Airline, Aircraft
 
+# Number of flight rows inserted and committed per batch
+INSERT_BATCH_SIZE = 1000
+
 def clear_existing_flights():
     """Clear all existing flights from the database."""
     print("🗑️  Clearing existing flight data...")
     
     with app.app_context():
         try:
-            # Delete all existing flights
-            Flight.query.delete()
+            # Delete all existing flights with a single server-side DELETE
+            db.session.execute(delete(Flight))
             db.session.commit()
             print("✅ Cleared existing flights")
         except Exception as e:
@@ -49,125 +54,168 @@ def scrape_and_save_flights():
     
     print(f"📊 Scraped {len(df)} flights")
     
+    # Parse HH:MM arrival times onto today's date in one vectorized pass;
+    # unparseable scheduled times fall back to now, actual times to NaT
+    now = datetime.now()
+    flight_date = now.date()
+    today = flight_date.isoformat()
+    df['scheduled_time'] = pd.to_datetime(
+        today + ' ' + df['scheduled_arrival'].astype(str), format='%Y-%m-%d %H:%M', errors='coerce'
+    ).fillna(pd.Timestamp(now))
+    df['actual_time'] = pd.to_datetime(
+        today + ' ' + df['actual_arrival'].astype(str), format='%Y-%m-%d %H:%M', errors='coerce'
+    )
+    
+    # Arrival delay in whole minutes, clipped at zero (0 when actual is unknown)
+    delay_seconds = (df['actual_time'] - df['scheduled_time']).dt.total_seconds().to_numpy()
+    df['arrival_delay_minutes'] = np.where(
+        np.isnan(delay_seconds), 0, np.clip(delay_seconds / 60.0, 0, None)
+    ).astype(np.int32)
+    
+    # Draw all simulated per-flight metrics up front with NumPy
+    rng = np.random.default_rng()
+    flight_count = len(df)
+    df['seats_available'] = rng.integers(10, 51, flight_count)
+    df['load_factor'] = rng.uniform(0.7, 0.95, flight_count)
+    df['on_time_probability'] = rng.uniform(0.6, 0.9, flight_count)
+    df['delay_probability'] = rng.uniform(0.1, 0.4, flight_count)
+    df['cancellation_probability'] = rng.uniform(0.01, 0.05, flight_count)
+    df['base_price'] = rng.uniform(200, 800, flight_count)
+    df['current_price'] = rng.uniform(200, 800, flight_count)
+    df['duration_minutes'] = rng.integers(120, 361, flight_count)
+    df['distance_miles'] = rng.integers(500, 2501, flight_count)
+    
     with app.app_context():
         saved_count = 0
         failed_count = 0
         
-        for _, row in df.iterrows():
-            try:
-                # Find or create airline
-                airline = Airline.query.filter_by(name=row['airline']).first()
-                if not airline:
-                    # Try to find by IATA code
-                    airline_code = row['flight_number'][:2] if len(row['flight_number']) >= 2 else 'XX'
-                    airline = Airline.query.filter_by(iata_code=airline_code).first()
-                    if not airline:
-                        # Create new airline
-                        airline = Airline(
-                            name=row['airline'],
-                            iata_code=airline_code,
-                            icao_code=airline_code,
-                            country='US'
-                        )
-                        db.session.add(airline)
-                        db.session.flush()
-                
-                # Find origin airport
-                origin_airport = Airport.query.filter_by(iata_code=row['origin']).first()
-                if not origin_airport:
-                    # Skip flights with unknown origins
-                    print(f"⚠️  Skipping flight {row['flight_number']} - unknown origin: {row['origin']}")
-                    failed_count += 1
-                    continue
-                
-                # Find destination airport (ORD)
-                dest_airport = Airport.query.filter_by(iata_code='ORD').first()
-                if not dest_airport:
-                    print("❌ ORD airport not found in database!")
-                    failed_count += 1
-                    continue
-                
-                # Get a random aircraft type
-                aircraft = Aircraft.query.first()
-                if not aircraft:
-                    # Create a default aircraft if none exist
-                    aircraft = Aircraft(
-                        type_code='Boeing 737-800',
-                        manufacturer='Boeing',
-                        model='737',
-                        variant='800',
-                        capacity=189,
-                        range_km=5765,
-                        cruise_speed_kmh=842
-                    )
-                    db.session.add(aircraft)
-                    db.session.flush()
-                
-                # Parse times
-                try:
-                    if row['scheduled_arrival'] != 'Unknown':
-                        scheduled_time = datetime.strptime(row['scheduled_arrival'], '%H:%M')
-                        scheduled_time = scheduled_time.replace(year=datetime.now().year, month=datetime.now().month, day=datetime.now().day)
-                    else:
-                        scheduled_time = datetime.now()
-                except:
-                    scheduled_time = datetime.now()
-                
-                try:
-                    if row['actual_arrival'] != 'Unknown':
-                        actual_time = datetime.strptime(row['actual_arrival'], '%H:%M')
-                        actual_time = actual_time.replace(year=datetime.now().year, month=datetime.now().month, day=datetime.now().day)
-                    else:
-                        actual_time = None
-                except:
-                    actual_time = None
-                
-                # Calculate delay
-                delay_minutes = 0
-                if actual_time and scheduled_time:
-                    delay_minutes = max(0, int((actual_time - scheduled_time).total_seconds() / 60))
-                
-                # Determine status
-                status = row['status'].upper() if row['status'] != 'Unknown' else 'SCHEDULED'
-                
-                # Create flight record
-                flight = Flight(
-                    flight_number=row['flight_number'],
-                    airline_id=airline.id,
-                    aircraft_id=aircraft.id,
-                    origin_airport_id=origin_airport.id,
-                    destination_airport_id=dest_airport.id,
-                    flight_date=datetime.now().date(),
-                    scheduled_departure=scheduled_time - timedelta(hours=2),  # Assume 2-hour flight
-                    actual_departure=None,
-                    scheduled_arrival=scheduled_time,
-                    actual_arrival=actual_time,
-                    status=status,
-                    gate=row.get('gate', 'TBD'),
-                    terminal=row.get('terminal', 'TBD'),
-                    delay_minutes=delay_minutes,
-                    seats_available=random.randint(10, 50),
-                    total_seats=aircraft.capacity,
-                    load_factor=random.uniform(0.7, 0.95),
-                    on_time_probability=random.uniform(0.6, 0.9),
-                    delay_probability=random.uniform(0.1, 0.4),
-                    cancellation_probability=random.uniform(0.01, 0.05),
-                    base_price=random.uniform(200, 800),
-                    current_price=random.uniform(200, 800),
-                    currency='USD',
-                    duration_minutes=random.randint(120, 360),
-                    distance_miles=random.randint(500, 2500)
+        # Flush only where IDs are needed explicitly; reference queries never autoflush
+        with db.session.no_autoflush:
+            # Load reference data once instead of querying per flight
+            airlines = Airline.query.all()
+            airline_ids_by_name = {airline.name: airline.id for airline in airlines}
+            airline_ids_by_iata = {airline.iata_code: airline.id for airline in airlines}
+            airports_df = pd.DataFrame(
+                [(airport.iata_code, airport.id) for airport in Airport.query.all()],
+                columns=['origin', 'origin_airport_id']
+            )
+            
+            # Find destination airport (ORD)
+            dest_airport_ids = airports_df.loc[airports_df['origin'] == 'ORD', 'origin_airport_id']
+            if dest_airport_ids.empty:
+                print("❌ ORD airport not found in database!")
+                print(f"⚠️  Failed to save {len(df)} flights")
+                return
+            dest_airport_id = int(dest_airport_ids.iloc[0])
+            
+            # Resolve origin airport IDs with one hash join; skip flights with unknown origins
+            df = df.merge(airports_df, on='origin', how='left')
+            unknown_origin = df['origin_airport_id'].isna()
+            for flight_number, origin in df.loc[unknown_origin, ['flight_number', 'origin']].itertuples(index=False):
+                print(f"⚠️  Skipping flight {flight_number} - unknown origin: {origin}")
+            failed_count += int(unknown_origin.sum())
+            df = df[~unknown_origin].astype({'origin_airport_id': 'int64'})
+            
+            # Resolve airline IDs by name, falling back to the flight number's IATA prefix
+            flight_numbers = df['flight_number'].astype(str)
+            df['iata_prefix'] = flight_numbers.str[:2].where(flight_numbers.str.len() >= 2, 'XX')
+            df['airline_id'] = df['airline'].map(airline_ids_by_name).fillna(
+                df['iata_prefix'].map(airline_ids_by_iata)
+            )
+            
+            # Create any airlines still missing in one bulk insert. As with a per-flight
+            # lookup, each new name is created once (with the prefix it first appears
+            # with) and later flights match it by name before trying their prefix
+            missing_airlines = df.loc[df['airline_id'].isna(), ['airline', 'iata_prefix']].drop_duplicates()
+            new_airline_codes = {}
+            for name, airline_code in missing_airlines.itertuples(index=False):
+                if name not in new_airline_codes and airline_code not in new_airline_codes.values():
+                    new_airline_codes[name] = airline_code
+            if new_airline_codes:
+                db.session.execute(Airline.__table__.insert(), [
+                    {'name': name, 'iata_code': airline_code, 'icao_code': airline_code, 'country': 'US'}
+                    for name, airline_code in new_airline_codes.items()
+                ])
+                airline_ids_by_iata.update(db.session.execute(
+                    select(Airline.iata_code, Airline.id).where(Airline.iata_code.in_(list(new_airline_codes.values())))
+                ).all())
+                airline_ids_by_name.update(
+                    (name, airline_ids_by_iata[airline_code]) for name, airline_code in new_airline_codes.items()
+                )
+                df['airline_id'] = df['airline'].map(airline_ids_by_name).fillna(
+                    df['iata_prefix'].map(airline_ids_by_iata)
                 )
+            df = df.astype({'airline_id': 'int64'})
+            
+            # Get a random aircraft type
+            aircraft = Aircraft.query.first()
+            if not aircraft:
+                # Create a default aircraft if none exist
+                aircraft = Aircraft(
+                    type_code='Boeing 737-800',
+                    manufacturer='Boeing',
+                    model='737',
+                    variant='800',
+                    capacity=189,
+                    range_km=5765,
+                    cruise_speed_kmh=842
+                )
+                db.session.add(aircraft)
+                db.session.flush()
+            
+            # Stream the scrape through fixed-size batches so only one batch of
+            # insert rows is held in memory, committing after each one
+            for batch_start in range(0, len(df), INSERT_BATCH_SIZE):
+                batch = df.iloc[batch_start:batch_start + INSERT_BATCH_SIZE]
+                flight_rows = []
                 
-                db.session.add(flight)
-                saved_count += 1
+                for row in batch.itertuples(index=False):
+                    try:
+                        scheduled_time = row.scheduled_time.to_pydatetime()
+                        actual_time = None if pd.isna(row.actual_time) else row.actual_time.to_pydatetime()
+                        
+                        # Determine status
+                        status = row.status.upper() if row.status != 'Unknown' else 'SCHEDULED'
+                        
+                        # Collect a plain row for this batch's bulk insert
+                        flight_rows.append({
+                            'flight_number': row.flight_number,
+                            'airline_id': row.airline_id,
+                            'aircraft_id': aircraft.id,
+                            'origin_airport_id': row.origin_airport_id,
+                            'destination_airport_id': dest_airport_id,
+                            'flight_date': flight_date,
+                            'scheduled_departure': scheduled_time - timedelta(hours=2),  # Assume 2-hour flight
+                            'actual_departure': None,
+                            'scheduled_arrival': scheduled_time,
+                            'actual_arrival': actual_time,
+                            'status': status,
+                            'gate': getattr(row, 'gate', 'TBD'),
+                            'terminal': getattr(row, 'terminal', 'TBD'),
+                            'delay_minutes': row.arrival_delay_minutes,
+                            'seats_available': row.seats_available,
+                            'total_seats': aircraft.capacity,
+                            'load_factor': row.load_factor,
+                            'on_time_probability': row.on_time_probability,
+                            'delay_probability': row.delay_probability,
+                            'cancellation_probability': row.cancellation_probability,
+                            'base_price': row.base_price,
+                            'current_price': row.current_price,
+                            'currency': 'USD',
+                            'duration_minutes': row.duration_minutes,
+                            'distance_miles': row.distance_miles
+                        })
+                    
+                    except Exception as e:
+                        print(f"❌ Error saving flight {getattr(row, 'flight_number', 'Unknown')}: {e}")
+                        failed_count += 1
+                        continue
                 
-            except Exception as e:
-                print(f"❌ Error saving flight {row.get('flight_number', 'Unknown')}: {e}")
-                failed_count += 1
-                continue
+                if flight_rows:
+                    db.session.execute(Flight.__table__.insert(), flight_rows)
+                db.session.commit()
+                saved_count += len(flight_rows)
         
-        db.session.commit()
         print(f"✅ Successfully saved {saved_count} flights to database")
         if failed_count > 0:
             print(f"⚠️  Failed to save {failed_count} flights")
@@ -186,7 +234,7 @@ def main():
         
         # Step 3: Verify the update
         with app.app_context():
-            flight_count = Flight.query.count()
+            flight_count = db.session.scalar(select(func.count()).select_from(Flight))
             print(f"\n🎉 Database update complete!")
             print(f"📊 Total flights in database: {flight_count}")
             
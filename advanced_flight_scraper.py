@@ -13,13 +13,36 @@ This scraper uses multiple techniques to get more flight data:
 import requests
 from bs4 import BeautifulSoup
 import pandas as pd
-import time
-import random
 from datetime import datetime, timedelta
 import json
+import multiprocessing
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from urllib.parse import urljoin, urlparse
 
+# Use the C-backed lxml tree builder when installed (see scraper_requirements.txt)
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Regex patterns shared by the parsers, compiled once at import
+FLIGHT_CARD_CLASS_RE = re.compile(r'flight|row|card')
+FLIGHT_FIELD_CLASS_RE = re.compile(r'flight|airline|time|status')
+FLIGHT_ROW_CLASS_RE = re.compile(r'flight|row')
+ARRIVAL_SECTION_CLASS_RE = re.compile(r'flight|arrival')
+EMBEDDED_FLIGHTS_JSON_RE = re.compile(r'({.*"flights".*})')
+FLIGHT_NUMBER_RE = re.compile(r'([A-Z]{2,3}\s?\d{3,4})')
+AIRLINE_PATTERNS = (
+    re.compile(r'([A-Z]{2,3})\s?\d{3,4}'),  # Airline code + flight number
+    re.compile(r'(United|Delta|American|Southwest|JetBlue|Spirit|Frontier|Alaska)'),
+)
+AIRPORT_CODE_RE = re.compile(r'([A-Z]{3})')
+TIME_RE = re.compile(r'(\d{1,2}:\d{2})')
+WHITESPACE_RE = re.compile(r'\s+')
+
 class AdvancedFlightScraper:
     def __init__(self, airport_code="KORD"):
         self.airport_code = airport_code
@@ -42,6 +65,9 @@ class AdvancedFlightScraper:
         
         self.session.headers.update(self.headers)
         
+        # Process pool for HTML parsing, only set while scrape_all_sources runs
+        self.parse_executor = None
+        
     def scrape_flightradar24_advanced(self):
         """Advanced FlightRadar24 scraping with multiple techniques."""
         flights = []
@@ -53,12 +79,12 @@ class AdvancedFlightScraper:
             
             response = self.session.get(url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
                 # Try multiple parsing strategies
-                flights.extend(self._parse_flightradar24_table(soup))
-                flights.extend(self._parse_flightradar24_divs(soup))
-                flights.extend(self._parse_flightradar24_json(soup))
+                flights.extend(self._parse_page(response.content, (
+                    '_parse_flightradar24_table',
+                    '_parse_flightradar24_divs',
+                    '_parse_flightradar24_json',
+                )))
                 
                 print(f"✅ FlightRadar24: Found {len(flights)} flights")
             else:
@@ -78,14 +104,11 @@ class AdvancedFlightScraper:
             url = f"https://flightaware.com/live/airport/{self.airport_code}/arrivals"
             print(f"🔍 Scraping FlightAware: {url}")
             
-            # Add FlightAware specific headers
-            headers = self.headers.copy()
-            headers['Referer'] = 'https://flightaware.com/'
-            
-            response = requests.get(url, headers=headers, timeout=10)
+            # Reuse the pooled session; only the FlightAware Referer is added
+            # on top of the session's default headers
+            response = self.session.get(url, headers={'Referer': 'https://flightaware.com/'}, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                flights.extend(self._parse_flightaware(soup))
+                flights.extend(self._parse_page(response.content, ('_parse_flightaware',)))
                 print(f"✅ FlightAware: Found {len(flights)} flights")
             else:
                 print(f"❌ FlightAware: HTTP {response.status_code}")
@@ -101,9 +124,10 @@ class AdvancedFlightScraper:
         
         try:
             # Try FlightStats API endpoints
+            date_path = datetime.now().strftime('%Y/%m/%d')
             api_urls = [
-                f"https://api.flightstats.com/flex/flightstatus/rest/v2/json/airport/status/{self.airport_code}/arr/{datetime.now().strftime('%Y/%m/%d')}",
-                f"https://api.flightstats.com/flex/flightstatus/rest/v2/json/airport/status/{self.airport_code}/dep/{datetime.now().strftime('%Y/%m/%d')}"
+                f"https://api.flightstats.com/flex/flightstatus/rest/v2/json/airport/status/{self.airport_code}/arr/{date_path}",
+                f"https://api.flightstats.com/flex/flightstatus/rest/v2/json/airport/status/{self.airport_code}/dep/{date_path}"
             ]
             
             for url in api_urls:
@@ -131,8 +155,7 @@ class AdvancedFlightScraper:
             
             response = self.session.get(url, timeout=10)
             if response.status_code == 200:
-                soup = BeautifulSoup(response.content, 'html.parser')
-                flights.extend(self._parse_official_ord(soup))
+                flights.extend(self._parse_page(response.content, ('_parse_official_ord',)))
                 print(f"✅ Official ORD: Found {len(flights)} flights")
             else:
                 print(f"❌ Official ORD: HTTP {response.status_code}")
@@ -142,6 +165,12 @@ class AdvancedFlightScraper:
             
         return flights
     
+    def _parse_page(self, content, parser_names):
+        """Parse a fetched page in the process pool, or inline when none is running."""
+        if self.parse_executor is None:
+            return parse_page(content, parser_names)
+        return self.parse_executor.submit(parse_page, content, parser_names).result()
+    
     def _parse_flightradar24_table(self, soup):
         """Parse FlightRadar24 table format."""
         flights = []
@@ -175,11 +204,11 @@ class AdvancedFlightScraper:
         flights = []
         
         # Look for flight cards/divs
-        flight_divs = soup.find_all('div', class_=re.compile(r'flight|row|card'))
+        flight_divs = soup.find_all('div', class_=FLIGHT_CARD_CLASS_RE)
         for div in flight_divs:
             try:
                 # Extract flight information from div structure
-                flight_elements = div.find_all(['span', 'div'], class_=re.compile(r'flight|airline|time|status'))
+                flight_elements = div.find_all(['span', 'div'], class_=FLIGHT_FIELD_CLASS_RE)
                 
                 if len(flight_elements) >= 4:
                     flight_data = {
@@ -208,7 +237,7 @@ class AdvancedFlightScraper:
             for script in scripts:
                 if script.string and 'flights' in script.string:
                     # Try to extract JSON
-                    json_match = re.search(r'({.*"flights".*})', script.string)
+                    json_match = EMBEDDED_FLIGHTS_JSON_RE.search(script.string)
                     if json_match:
                         try:
                             data = json.loads(json_match.group(1))
@@ -225,7 +254,7 @@ class AdvancedFlightScraper:
         flights = []
         
         # FlightAware specific parsing
-        flight_rows = soup.find_all('tr', class_=re.compile(r'flight|row'))
+        flight_rows = soup.find_all('tr', class_=FLIGHT_ROW_CLASS_RE)
         for row in flight_rows:
             try:
                 cells = row.find_all('td')
@@ -274,7 +303,7 @@ class AdvancedFlightScraper:
         flights = []
         
         # Official ORD specific parsing
-        flight_sections = soup.find_all(['div', 'section'], class_=re.compile(r'flight|arrival'))
+        flight_sections = soup.find_all(['div', 'section'], class_=ARRIVAL_SECTION_CLASS_RE)
         for section in flight_sections:
             try:
                 flight_data = {
@@ -296,20 +325,15 @@ class AdvancedFlightScraper:
     def _extract_flight_number(self, element):
         """Extract flight number from element."""
         text = element.get_text()
-        flight_match = re.search(r'([A-Z]{2,3}\s?\d{3,4})', text)
+        flight_match = FLIGHT_NUMBER_RE.search(text)
         return flight_match.group(1).strip() if flight_match else ''
     
     def _extract_airline(self, element):
         """Extract airline from element."""
         # Look for airline codes or names
-        airline_patterns = [
-            r'([A-Z]{2,3})\s?\d{3,4}',  # Airline code + flight number
-            r'(United|Delta|American|Southwest|JetBlue|Spirit|Frontier|Alaska)',
-        ]
-        
         text = element.get_text()
-        for pattern in airline_patterns:
-            match = re.search(pattern, text)
+        for pattern in AIRLINE_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         return ''
@@ -317,18 +341,18 @@ class AdvancedFlightScraper:
     def _extract_origin(self, element):
         """Extract origin airport from element."""
         # Look for airport codes
-        airport_match = re.search(r'([A-Z]{3})', element.get_text())
+        airport_match = AIRPORT_CODE_RE.search(element.get_text())
         return airport_match.group(1) if airport_match else 'Unknown'
     
     def _extract_scheduled_time(self, element):
         """Extract scheduled time from element."""
-        time_match = re.search(r'(\d{1,2}:\d{2})', element.get_text())
+        time_match = TIME_RE.search(element.get_text())
         return time_match.group(1) if time_match else 'Unknown'
     
     def _extract_actual_time(self, element):
         """Extract actual time from element."""
         # Look for actual/estimated times
-        times = re.findall(r'(\d{1,2}:\d{2})', element.get_text())
+        times = TIME_RE.findall(element.get_text())
         return times[1] if len(times) > 1 else 'Unknown'
     
     def _extract_status(self, element):
@@ -372,7 +396,7 @@ class AdvancedFlightScraper:
         """Clean and normalize text."""
         if not text:
             return ''
-        return re.sub(r'\s+', ' ', text.strip())
+        return WHITESPACE_RE.sub(' ', text.strip())
     
     def scrape_all_sources(self):
         """Scrape from all available sources."""
@@ -389,17 +413,28 @@ class AdvancedFlightScraper:
             self.scrape_airport_official,
         ]
         
-        for source_func in sources:
-            try:
-                flights = source_func()
-                all_flights.extend(flights)
-                
-                # Add delay between requests
-                time.sleep(random.uniform(2, 5))
+        # Each source is a different host, so fetch them concurrently rather
+        # than sleeping between sequential requests; results are gathered in
+        # source order so duplicate resolution stays deterministic. The
+        # CPU-bound BeautifulSoup parsing is handed to worker processes so
+        # pages parse in parallel instead of contending for the GIL. Workers
+        # are spawned, not forked: they start while the fetch threads hold
+        # socket and logging locks, which a forked child would inherit locked
+        parse_workers = min(len(sources), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=parse_workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as self.parse_executor, \
+                    ThreadPoolExecutor(max_workers=len(sources)) as executor:
+                futures = [executor.submit(source_func) for source_func in sources]
                 
-            except Exception as e:
-                print(f"❌ Source error: {e}")
-                continue
+                for future in futures:
+                    try:
+                        all_flights.extend(future.result())
+                    except Exception as e:
+                        print(f"❌ Source error: {e}")
+                        continue
+        finally:
+            self.parse_executor = None
         
         # Remove duplicates
         unique_flights = self._remove_duplicates(all_flights)
@@ -411,16 +446,30 @@ class AdvancedFlightScraper:
     
     def _remove_duplicates(self, flights):
         """Remove duplicate flights based on flight number."""
-        seen = set()
-        unique_flights = []
-        
+        # Keyed on the upper-cased flight number: the first occurrence wins and
+        # insertion order is kept. The dicts are passed through untouched, so
+        # keys one source omits stay missing rather than becoming NaN
+        unique_flights = {}
         for flight in flights:
-            flight_key = flight['flight_number'].upper()
-            if flight_key not in seen and flight_key:
-                seen.add(flight_key)
-                unique_flights.append(flight)
-                
-        return unique_flights
+            flight_key = (flight.get('flight_number') or '').upper()
+            if flight_key:
+                unique_flights.setdefault(flight_key, flight)
+        
+        return list(unique_flights.values())
+
+def parse_page(content, parser_names):
+    """Parse raw page bytes with the named AdvancedFlightScraper parsers.
+    
+    Module-level so it can be pickled into a ProcessPoolExecutor worker;
+    returns plain flight dicts.
+    """
+    scraper = AdvancedFlightScraper()
+    soup = BeautifulSoup(content, HTML_PARSER)
+    
+    flights = []
+    for parser_name in parser_names:
+        flights.extend(getattr(scraper, parser_name)(soup))
+    return flights
 
 def main():
     """Main function to run the advanced scraper."""
@@ -432,17 +481,17 @@ def main():
         df = pd.DataFrame(flights)
         
         # Add timestamp
-        df['scraped_at'] = datetime.now().isoformat()
+        now = datetime.now()
+        df['scraped_at'] = now.isoformat()
         
-        # Clean and sort
-        df = df.dropna(subset=['flight_number'])
+        # Sort (blank and duplicate flight numbers were already removed)
         df = df.sort_values('flight_number')
         
         print(f"\n📋 Sample flights found:")
         print(df.head(10).to_string(index=False))
         
         # Save to CSV
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
         filename = f'advanced_ord_flights_{timestamp}.csv'
         df.to_csv(filename, index=False)
         print(f"\n💾 Data saved to: {filename}")
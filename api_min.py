@@ -1,26 +1,34 @@
-from flask import Flask, jsonify, request
+import json
+
+from flask import Flask, Response, jsonify, request
 from flask_cors import CORS
 
 app = Flask(__name__)
 CORS(app)
 
+# Static payloads are serialized once at import and served as raw bytes
+AIRLINES_JSON = json.dumps({
+    "airlines": [
+        {"name": "Delta Air Lines", "iata_code": "DL"},
+        {"name": "United Airlines", "iata_code": "UA"},
+        {"name": "American Airlines", "iata_code": "AA"},
+        {"name": "Southwest Airlines", "iata_code": "WN"},
+        {"name": "JetBlue", "iata_code": "B6"},
+        {"name": "Alaska Airlines", "iata_code": "AS"},
+    ]
+}, separators=(",", ":")).encode()
+
+MONTHS_JSON = json.dumps({
+    "periods": [{"year": y, "month": m} for y in range(2022, 2028) for m in range(1, 13)]
+}, separators=(",", ":")).encode()
+
 @app.get("/api/airlines")
 def airlines():
-    return jsonify({
-        "airlines": [
-            {"name": "Delta Air Lines", "iata_code": "DL"},
-            {"name": "United Airlines", "iata_code": "UA"},
-            {"name": "American Airlines", "iata_code": "AA"},
-            {"name": "Southwest Airlines", "iata_code": "WN"},
-            {"name": "JetBlue", "iata_code": "B6"},
-            {"name": "Alaska Airlines", "iata_code": "AS"},
-        ]
-    })
+    return Response(AIRLINES_JSON, mimetype="application/json")
 
 @app.get("/api/airline-performance/available-months")
 def months():
-    periods = [{"year": y, "month": m} for y in range(2022, 2028) for m in range(1, 13)]
-    return jsonify({"periods": periods})
+    return Response(MONTHS_JSON, mimetype="application/json")
 
 @app.get("/api/airline-performance/predict")
 def predict():
@@ -77,5 +85,11 @@ def flights_status():
     return jsonify({"flights": flights, "lastUpdated": date})
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8000, debug=True)
+    try:
+        from waitress import serve
+    except ImportError:
+        # Fall back to the threaded Werkzeug server, never with the debugger on
+        app.run(host="0.0.0.0", port=8000, debug=False, threaded=True)
+    else:
+        serve(app, host="0.0.0.0", port=8000, threads=8)
 
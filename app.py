@@ -1,39 +1,358 @@
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import and_, or_, desc, func
+from sqlalchemy import and_, or_, desc, event, func, select
+from sqlalchemy.orm import raiseload
+from sqlalchemy.pool import QueuePool
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 import base64
 from io import BytesIO
 import json
-from datetime import datetime, timezone, timedelta
+import hashlib
+import hmac
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from datetime import date, datetime, timezone, timedelta
 import os
+import re
 from models import db, Airport, Airline, Aircraft, Flight, FlightStatus, Route, Weather, AirlineMonthlyPerformance
 from ml_predictor import FlightDelayPredictor
 
+# Encode responses with the C-backed orjson when installed (see requirements.txt)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Share ML predictions across worker processes through Redis when configured
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Compress large JSON responses (brotli preferred, gzip fallback) when installed
+try:
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
+
+class ISOJSONProvider(DefaultJSONProvider):
+    """Default Flask JSON provider, but writing dates and datetimes as ISO 8601 like orjson does"""
+    
+    @staticmethod
+    def default(o):
+        if isinstance(o, (date, datetime)):
+            return o.isoformat()
+        return DefaultJSONProvider.default(o)
+
+class ORJSONProvider(ISOJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and all JSON responses"""
+    
+    def dumps(self, obj, **kwargs):
+        # Keys stay sorted like the default provider; numpy scalars from the ML models encode natively
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 app = Flask(__name__)
+# Either provider encodes datetimes itself, so handlers pass them through as-is
+app.json = ORJSONProvider(app) if orjson is not None else ISOJSONProvider(app)
 CORS(app)  # Enable CORS for all routes
 
+# Response compression; small bodies are not worth the extra bytes and CPU
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_MIN_SIZE'] = 1024
+# Fast levels: JSON shrinks most of the way at level 4, higher levels mostly cost CPU
+app.config['COMPRESS_LEVEL'] = 4
+app.config['COMPRESS_BR_LEVEL'] = 4
+app.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/html', 'text/css', 'application/javascript']
+if Compress is not None:
+    Compress(app)
+
 # Database configuration
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///ontime.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+# Reuse pooled connections rather than reconnecting per session; sized for
+# gevent workers (see wsgi.py) serving many requests concurrently
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'poolclass': QueuePool,
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_pre_ping': True,
+    # Wait for a concurrent writer instead of failing with "database is locked"
+    'connect_args': {'timeout': 15}
+}
 
 # Initialize database
 db.init_app(app)
 
+def _configure_sqlite_connection(dbapi_connection, connection_record):
+    """Tune each new SQLite connection for concurrent, read-heavy API traffic"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute('PRAGMA journal_mode=WAL')  # Readers no longer block on the scrapers' writes
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA mmap_size=268435456')  # Serve page reads from a 256 MB memory map
+    cursor.execute('PRAGMA cache_size=-65536')  # 64 MB page cache per connection
+    cursor.execute('PRAGMA temp_store=MEMORY')  # Sorts and GROUP BY temp tables stay off disk
+    cursor.close()
+
+with app.app_context():
+    if db.engine.dialect.name == 'sqlite':
+        event.listen(db.engine, 'connect', _configure_sqlite_connection)
+
+# With SQL_RAISELOAD=1 any relationship not eager-loaded raises instead of lazy
+# loading, so N+1 query regressions fail in development and CI
+LOAD_STRICT = os.getenv('SQL_RAISELOAD') == '1'
+
+def _load_options(*options):
+    """ORM loader options for a query, plus raiseload('*') in strict mode"""
+    return [*options, *([raiseload('*')] if LOAD_STRICT else [])]
+
+# Seconds a serialized response body stays cached
+FLIGHTS_CACHE_TTL = 30
+FLIGHT_STATUS_CACHE_TTL = 60
+# Model metrics only change when the models are reloaded, which replaces the cached body
+MODEL_PERFORMANCE_CACHE_TTL = float('inf')
+# Monthly airline performance for completed months rarely changes; late imports show up within a day
+MONTHLY_PERFORMANCE_CACHE_TTL = 24 * 60 * 60
+
+# /api/flights page size when the caller gives none, and the largest page served
+FLIGHTS_PAGE_SIZE = 100
+FLIGHTS_MAX_PAGE_SIZE = 500
+
+# Serialized JSON bodies keyed by endpoint: {key: (expires_at, etag, body)}
+_response_cache = {}
+
+# Most recently used ML prediction bodies, keyed by the flight state and model version they depend on
+ML_PREDICTION_CACHE_SIZE = 4096
+_ml_prediction_cache = OrderedDict()
+_ml_prediction_cache_lock = threading.Lock()
+
+# Concurrent /api/predict/ml requests are scored together: the batch worker waits
+# this long for more flights, up to ML_BATCH_MAX_SIZE per model call
+ML_BATCH_WINDOW_SECONDS = 0.01
+ML_BATCH_MAX_SIZE = 32
+# Longest wait on the batch worker before scoring the flight directly instead
+ML_BATCH_TIMEOUT_SECONDS = 1.0
+_ml_batch_queue = queue.Queue()
+_ml_batch_worker = None
+_ml_batch_worker_lock = threading.Lock()
+
+# With REDIS_URL set, prediction bodies live in Redis for this many seconds
+ML_PREDICTION_REDIS_TTL = 60
+redis_client = None
+if redis is not None and os.environ.get('REDIS_URL'):
+    redis_client = redis.Redis.from_url(os.environ['REDIS_URL'])
+
+def _ml_batch_loop():
+    """Collect queued ML prediction requests and score each batch with one model call"""
+    while True:
+        batch = [_ml_batch_queue.get()]
+        deadline = time.monotonic() + ML_BATCH_WINDOW_SECONDS
+        while len(batch) < ML_BATCH_MAX_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(_ml_batch_queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        
+        # Skip requests that timed out and were scored directly instead
+        batch = [(flight_data, future) for flight_data, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            continue
+        
+        flights_data = [flight_data for flight_data, _ in batch]
+        try:
+            if len(flights_data) == 1:
+                predictions = [ml_predictor.predict_delay(flights_data[0])]
+            else:
+                predictions = ml_predictor.predict_delay_many(flights_data)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            continue
+        
+        for (_, future), prediction in zip(batch, predictions):
+            future.set_result(prediction)
+
+def _predict_delay_coalesced(flight_data):
+    """Queue a flight for the next ML batch and wait for its prediction"""
+    global _ml_batch_worker
+    # Started on first use so each forked worker process gets its own thread
+    if _ml_batch_worker is None:
+        with _ml_batch_worker_lock:
+            if _ml_batch_worker is None:
+                _ml_batch_worker = threading.Thread(target=_ml_batch_loop, daemon=True)
+                _ml_batch_worker.start()
+    
+    future = Future()
+    _ml_batch_queue.put((flight_data, future))
+    try:
+        return future.result(timeout=ML_BATCH_TIMEOUT_SECONDS)
+    except FutureTimeoutError:
+        # Batch worker is backed up: score this flight directly unless its batch already started
+        if future.cancel():
+            return ml_predictor.predict_delay(flight_data)
+        return future.result()
+
+def _store_json_body(key, ttl, payload, etag=None):
+    """Encode a payload (or take an already encoded body), cache it with its ETag and return the entry
+
+    The ETag defaults to a hash of the body.
+    """
+    now = time.monotonic()
+    body = payload if isinstance(payload, bytes) else app.json.response(payload).get_data()
+    etag = etag or hashlib.blake2b(body, digest_size=8).hexdigest()
+    entry = (now + ttl, etag, body)
+    # Drop expired bodies so per-page keys cannot pile up
+    for stale_key in [k for k, cached in list(_response_cache.items()) if cached[0] <= now]:
+        _response_cache.pop(stale_key, None)
+    _response_cache[key] = entry
+    return entry
+
+def _cached_json_response(key, ttl, build_payload):
+    """Serve a cached JSON body with an ETag, answering 304 when the client already has it
+
+    build_payload may return the payload object or an already encoded body; a
+    Response or (response, status) tuple, such as an error, is sent uncached.
+    """
+    entry = _response_cache.get(key)
+    if entry is None or entry[0] <= time.monotonic():
+        payload = build_payload()
+        if isinstance(payload, (Response, tuple)):
+            return payload
+        entry = _store_json_body(key, ttl, payload)
+    
+    _, etag, body = entry
+    if _client_has_version(etag):
+        return _not_modified(etag)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+def _is_past_month(year, month):
+    """Whether a (year, month) is over, so its monthly performance figures are final"""
+    today = datetime.now(timezone.utc)
+    return (year, month) < (today.year, today.month)
+
+def _version_etag(*parts):
+    """ETag for the data version a response is built from, known before building it"""
+    return hashlib.blake2b('|'.join(str(part) for part in parts).encode(), digest_size=16).hexdigest()
+
+def _client_has_version(etag):
+    """Whether If-None-Match names this ETag, including Flask-Compress's per-encoding variants"""
+    return any(request.if_none_match.contains(tag) for tag in (etag, f'{etag}:br', f'{etag}:gzip'))
+
+def _not_modified(etag):
+    """Empty 304 answer for a client that already holds the current version"""
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+# Airports are static reference data, serialized once: {iata_code: airport dict}
+_airports_by_iata = {}
+
+# Airline names and aircraft type codes by id, for per-flight lookups without joins
+_airline_names = {}
+_aircraft_types = {}
+
+def _airline_name(airline_id):
+    """Airline name for an id, reloading the small airlines table on a miss; None if unknown"""
+    if airline_id not in _airline_names:
+        _airline_names.update(db.session.execute(select(Airline.id, Airline.name)).all())
+        _airline_names.setdefault(airline_id, None)
+    return _airline_names[airline_id]
+
+def _aircraft_type(aircraft_id):
+    """Aircraft type code for an id, reloading the small aircraft table on a miss; None if unknown"""
+    if aircraft_id not in _aircraft_types:
+        _aircraft_types.update(db.session.execute(select(Aircraft.id, Aircraft.type_code)).all())
+        _aircraft_types.setdefault(aircraft_id, None)
+    return _aircraft_types[aircraft_id]
+
+# Last formatted UTC timestamp as [epoch second, ISO string]
+_utc_now_cache = [0, '']
+
+def _utc_now_isoformat():
+    """Current UTC time in ISO format, formatted at most once per second"""
+    now = int(time.time())
+    if now != _utc_now_cache[0]:
+        _utc_now_cache[:] = [now, datetime.fromtimestamp(now, timezone.utc).isoformat()]
+    return _utc_now_cache[1]
+
+def _prediction_redis_key(cache_key):
+    return 'pred:' + ':'.join(str(part) for part in cache_key)
+
+def _get_cached_prediction(cache_key):
+    """Return a cached ML prediction body from Redis, or this process's LRU when Redis is unavailable"""
+    if redis_client is not None:
+        try:
+            return redis_client.get(_prediction_redis_key(cache_key))
+        except redis.RedisError:
+            pass
+    
+    with _ml_prediction_cache_lock:
+        body = _ml_prediction_cache.get(cache_key)
+        if body is not None:
+            _ml_prediction_cache.move_to_end(cache_key)
+        return body
+
+def _cache_prediction(cache_key, body):
+    """Store an ML prediction body in Redis, or this process's LRU when Redis is unavailable"""
+    if redis_client is not None:
+        try:
+            redis_client.setex(_prediction_redis_key(cache_key), ML_PREDICTION_REDIS_TTL, body)
+            return
+        except redis.RedisError:
+            pass
+    
+    with _ml_prediction_cache_lock:
+        _ml_prediction_cache[cache_key] = body
+        if len(_ml_prediction_cache) > ML_PREDICTION_CACHE_SIZE:
+            _ml_prediction_cache.popitem(last=False)
+
+def _clear_prediction_cache():
+    """Drop cached ML predictions from Redis and this process's LRU"""
+    if redis_client is not None:
+        try:
+            keys = list(redis_client.scan_iter('pred:*'))
+            if keys:
+                redis_client.delete(*keys)
+        except redis.RedisError:
+            pass
+    
+    with _ml_prediction_cache_lock:
+        _ml_prediction_cache.clear()
+
 def init_database():
     """Initialize database connection and create tables if needed"""
     try:
         with app.app_context():
-            # Check if database exists and has data
-            flight_count = Flight.query.count()
-            if flight_count == 0:
+            # Check if database exists and has data; stops at the first row instead of counting them all
+            has_flights = db.session.execute(select(Flight.id).limit(1)).first() is not None
+            if not has_flights:
                 print("⚠️  Database is empty. Run 'python init_db.py' to populate it.")
                 return False
             else:
-                print(f"✅ Database connected successfully with {flight_count} flights")
+                print("✅ Database connected successfully")
+                _airports_by_iata.update(
+                    (airport.iata_code, airport.to_dict()) for airport in Airport.query.all()
+                )
+                _airline_names.update(db.session.execute(select(Airline.id, Airline.name)).all())
+                _aircraft_types.update(db.session.execute(select(Aircraft.id, Aircraft.type_code)).all())
                 return True
     except Exception as e:
         print(f"❌ Database initialization error: {e}")
@@ -45,14 +364,45 @@ db_initialized = init_database()
 # Initialize ML predictor
 ml_predictor = None
 ml_models_loaded = False
+# Fingerprint of the model files last loaded; part of every cached ML response's version
+ml_model_version = None
+
+def _model_files_version(model_dir):
+    """Hash of the saved model files' names, sizes and mtimes, identical in every worker process"""
+    digest = hashlib.blake2b(digest_size=8)
+    if os.path.isdir(model_dir):
+        for entry in sorted(os.scandir(model_dir), key=lambda entry: entry.name):
+            if entry.name.endswith('.joblib'):
+                stat = entry.stat()
+                digest.update(f'{entry.name}:{stat.st_size}:{stat.st_mtime_ns};'.encode())
+    return digest.hexdigest()
+
+def _model_performance_payload():
+    """Performance metrics and feature list of the loaded models"""
+    feature_columns = getattr(ml_predictor, 'feature_columns', [])
+    return {
+        'models': ml_predictor.get_model_performance(),
+        'best_model': getattr(ml_predictor, 'best_model', 'unknown'),
+        'feature_count': len(feature_columns),
+        'feature_columns': feature_columns
+    }
 
 def init_ml_predictor():
     """Initialize ML predictor and load models."""
-    global ml_predictor, ml_models_loaded
+    global ml_predictor, ml_models_loaded, ml_model_version
     try:
         ml_predictor = FlightDelayPredictor()
+        # Fingerprint before loading, so files replaced mid-load get a new version on the next reload
+        model_version = _model_files_version(ml_predictor.model_dir)
         ml_models_loaded = ml_predictor.load_models()
+        ml_model_version = model_version if ml_models_loaded else None
+        # Bodies built from the previous models are never served again; free them now
+        for key in [key for key in list(_response_cache) if key == 'model_performance' or (isinstance(key, tuple) and key[0] == 'flight_status')]:
+            _response_cache.pop(key, None)
+        _clear_prediction_cache()
         if ml_models_loaded:
+            # Encode the metrics once here rather than on the first request
+            _store_json_body('model_performance', MODEL_PERFORMANCE_CACHE_TTL, _model_performance_payload())
             print(f"✅ ML models loaded successfully. Best model: {getattr(ml_predictor, 'best_model', 'unknown')}")
         else:
             print("⚠️  ML models not found. Run 'python train_ml_models.py' to train models.")
@@ -79,6 +429,8 @@ def index():
             '/api/predict/<flight_id>',
             '/api/predict/ml/<flight_id>',
             '/api/models/performance',
+            '/api/models/reload',
+            '/api/cache/flush',
             '/flights/status',
             '/flights/delay-analysis',
             '/api/airlines',
@@ -90,21 +442,52 @@ def index():
 
 @app.route('/api/flights')
 def get_flights():
-    """Get list of all flights - Database powered"""
+    """Get a page of flights - Database powered"""
     if not db_initialized:
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
     
     try:
-        with app.app_context():
-            flights = Flight.query.options(
-                db.joinedload(Flight.airline),
-                db.joinedload(Flight.aircraft),
-                db.joinedload(Flight.origin_airport),
-                db.joinedload(Flight.destination_airport)
-            ).all()
+        limit = min(int(request.args.get('limit', FLIGHTS_PAGE_SIZE)), FLIGHTS_MAX_PAGE_SIZE)
+        offset = int(request.args.get('offset', 0))
+    except ValueError:
+        return jsonify({'error': 'limit and offset must be integers'}), 400
+    if limit < 1 or offset < 0:
+        return jsonify({'error': 'limit must be positive and offset non-negative'}), 400
+    
+    try:
+        def build_payload():
+            # Serialize each reference record once instead of once per flight
+            airlines = {airline.id: airline.to_dict() for airline in Airline.query.all()}
+            aircraft = {plane.id: plane.to_dict() for plane in Aircraft.query.all()}
+            airports = {airport.id: airport.to_dict() for airport in Airport.query.all()}
             
-            flights_list = [flight.to_dict() for flight in flights]
-            return jsonify({'flights': flights_list})
+            # Read flights as plain Core rows in batches of 200 and encode each
+            # row as it arrives, so no list of flight dicts is ever held
+            rows = db.session.execute(
+                select(Flight.__table__)
+                .order_by(Flight.id)
+                .limit(limit)
+                .offset(offset)
+                .execution_options(yield_per=200)
+            ).mappings()
+            encoded_flights = [
+                app.json.dumps(Flight.row_to_dict(
+                    row,
+                    airline=airlines.get(row['airline_id']),
+                    aircraft=aircraft.get(row['aircraft_id']),
+                    origin_airport=airports.get(row['origin_airport_id']),
+                    destination_airport=airports.get(row['destination_airport_id'])
+                ), separators=(',', ':'))
+                for row in rows
+            ]
+            total = db.session.execute(select(func.count()).select_from(Flight)).scalar()
+            return (
+                '{"flights":[' + ','.join(encoded_flights) + ']'
+                f',"limit":{limit},"offset":{offset},"total":{total}}}\n'
+            ).encode()
+        
+        # The flight list only changes when the scrapers reload the table
+        return _cached_json_response(('flights', limit, offset), FLIGHTS_CACHE_TTL, build_payload)
     except Exception as e:
         return jsonify({'error': f'Failed to fetch flights: {str(e)}'}), 500
 
@@ -115,21 +498,22 @@ def predict_delay(flight_id):
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
         
     try:
-        with app.app_context():
-            flight = Flight.query.filter_by(flight_number=flight_id).first()
-            if not flight:
-                return jsonify({'error': 'Flight not found'}), 404
-            
-            prediction = {
-                'flight_number': flight.flight_number,
-                'airline': flight.airline.name if flight.airline else 'Unknown',
-                'on_time_probability': flight.on_time_probability or 0.5,
-                'delay_probability': flight.delay_probability or 0.3,
-                'cancellation_probability': flight.cancellation_probability or 0.05,
-                'predicted_delay_minutes': flight.delay_minutes or 0,
-                'status': flight.status
-            }
-            return jsonify(prediction)
+        flight = Flight.query.options(*_load_options()).filter_by(flight_number=flight_id).first()
+        if not flight:
+            return jsonify({'error': 'Flight not found'}), 404
+        
+        prediction = {
+            'flight_number': flight.flight_number,
+            'airline': _airline_name(flight.airline_id) or 'Unknown',
+            'on_time_probability': flight.on_time_probability or 0.5,
+            'delay_probability': flight.delay_probability or 0.3,
+            'cancellation_probability': flight.cancellation_probability or 0.05,
+            'predicted_delay_minutes': flight.delay_minutes or 0,
+            'status': flight.status
+        }
+        response = jsonify(prediction)
+        response.add_etag()
+        return response.make_conditional(request)
     except Exception as e:
         return jsonify({'error': f'Failed to predict delay: {str(e)}'}), 500
 
@@ -143,64 +527,40 @@ def predict_delay_ml(flight_id):
         return jsonify({'error': 'ML models not loaded. Please run train_ml_models.py first.'}), 500
         
     try:
-        with app.app_context():
-            flight = Flight.query.filter_by(flight_number=flight_id).first()
-            if not flight:
-                return jsonify({'error': 'Flight not found'}), 404
-            
-            # Prepare flight data for ML prediction
-            flight_data = {
-                'flight_number': flight.flight_number,
-                'airline': flight.airline.name if flight.airline else 'Unknown',
-                'aircraft_type': flight.aircraft.type_code if flight.aircraft else 'Unknown',
-                'origin': flight.origin_airport.iata_code if flight.origin_airport else 'Unknown',
-                'destination': flight.destination_airport.iata_code if flight.destination_airport else 'Unknown',
-                'scheduled_departure': flight.scheduled_departure,
-                'actual_departure': flight.actual_departure,
-                'scheduled_arrival': flight.scheduled_arrival,
-                'actual_arrival': flight.actual_arrival,
-                'gate': flight.gate,
-                'terminal': flight.terminal,
-                'status': flight.status,
-                'delay_minutes': flight.delay_minutes or 0,
-                'seats_available': flight.seats_available,
-                'total_seats': flight.total_seats,
-                'on_time_probability': flight.on_time_probability,
-                'duration_minutes': flight.duration_minutes,
-                'distance_miles': flight.distance_miles,
-                'flight_date': flight.flight_date
-            }
-            
-            # Get ML prediction
-            ml_prediction = ml_predictor.predict_delay(flight_data)
-            
-            # Combine with database prediction
-            prediction = {
-                'flight_number': flight.flight_number,
-                'airline': flight.airline.name if flight.airline else 'Unknown',
-                'route': f"{flight.origin_airport.iata_code if flight.origin_airport else 'Unknown'} → {flight.destination_airport.iata_code if flight.destination_airport else 'Unknown'}",
-                'scheduled_departure': flight.scheduled_departure.isoformat() if flight.scheduled_departure else None,
-                'current_status': flight.status,
-                'actual_delay_minutes': flight.delay_minutes or 0,
-                
-                # ML Predictions
-                'ml_predicted_delay_minutes': ml_prediction['predicted_delay_minutes'],
-                'ml_confidence_interval': ml_prediction['confidence_interval'],
-                'ml_prediction_quality': ml_prediction['prediction_quality'],
-                'ml_model_used': ml_prediction['model_used'],
-                
-                # Database Predictions (for comparison)
-                'db_on_time_probability': flight.on_time_probability or 0.5,
-                'db_delay_probability': flight.delay_probability or 0.3,
-                'db_cancellation_probability': flight.cancellation_probability or 0.05,
-                
-                # Combined Analysis
-                'recommendation': _get_flight_recommendation(ml_prediction, flight),
-                'risk_factors': _analyze_risk_factors(flight_data)
-            }
-            
-            return jsonify(prediction)
-            
+        # Only fetch the columns the cache key depends on; the joined flight is loaded on a miss
+        flight_state = db.session.execute(
+            select(Flight.id, Flight.updated_at, Flight.status, Flight.delay_minutes)
+            .where(Flight.flight_number == flight_id)
+            .limit(1)
+        ).first()
+        if not flight_state:
+            return jsonify({'error': 'Flight not found'}), 404
+        
+        # Identical flight state and models give an identical prediction, so reuse the body;
+        # the model version keeps workers on different models from sharing Redis entries
+        cache_key = (*flight_state, ml_model_version)
+        etag = _version_etag(*cache_key, getattr(ml_predictor, 'best_model', None))
+        if _client_has_version(etag):
+            response = _not_modified(etag)
+            response.cache_control.private = True
+            response.cache_control.max_age = 15
+            return response
+        
+        body = _get_cached_prediction(cache_key)
+        if body is None:
+            flight = db.session.get(Flight, flight_state.id, options=_load_options(
+                db.joinedload(Flight.origin_airport),
+                db.joinedload(Flight.destination_airport)
+            ))
+            body = app.json.response(_build_ml_prediction(flight)).get_data()
+            _cache_prediction(cache_key, body)
+        
+        response = Response(body, mimetype='application/json')
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.max_age = 15
+        return response
+        
     except Exception as e:
         return jsonify({'error': f'Failed to predict delay with ML: {str(e)}'}), 500
 
@@ -211,16 +571,100 @@ def get_model_performance():
         return jsonify({'error': 'ML models not loaded. Please run train_ml_models.py first.'}), 500
     
     try:
-        performance = ml_predictor.get_model_performance()
-        return jsonify({
-            'models': performance,
-            'best_model': getattr(ml_predictor, 'best_model', 'unknown'),
-            'feature_count': len(ml_predictor.feature_columns) if hasattr(ml_predictor, 'feature_columns') else 0,
-            'feature_columns': ml_predictor.feature_columns if hasattr(ml_predictor, 'feature_columns') else []
-        })
+        # Metrics only change when the models are retrained and reloaded
+        return _cached_json_response('model_performance', MODEL_PERFORMANCE_CACHE_TTL, _model_performance_payload)
     except Exception as e:
         return jsonify({'error': f'Failed to get model performance: {str(e)}'}), 500
 
+def _is_admin_request():
+    """Whether the X-Admin-Token header matches ADMIN_TOKEN; always False when it is unset"""
+    admin_token = os.environ.get('ADMIN_TOKEN')
+    return bool(admin_token) and hmac.compare_digest(request.headers.get('X-Admin-Token', ''), admin_token)
+
+@app.route('/api/models/reload', methods=['POST'])
+def reload_models():
+    """Reload the trained ML models from disk without restarting (requires ADMIN_TOKEN)"""
+    if not _is_admin_request():
+        return jsonify({'error': 'Forbidden'}), 403
+    
+    loaded = init_ml_predictor()
+    return jsonify({
+        'ml_models_loaded': loaded,
+        'best_model': getattr(ml_predictor, 'best_model', 'unknown')
+    }), 200 if loaded else 500
+
+@app.route('/api/cache/flush', methods=['POST'])
+def flush_cache():
+    """Drop all cached response bodies, ML predictions and reference data (requires ADMIN_TOKEN)"""
+    if not _is_admin_request():
+        return jsonify({'error': 'Forbidden'}), 403
+    
+    _response_cache.clear()
+    _airports_by_iata.clear()
+    _airline_names.clear()
+    _aircraft_types.clear()
+    _clear_prediction_cache()
+    return jsonify({'status': 'flushed'})
+
+def _build_ml_prediction(flight: Flight) -> dict:
+    """Run the ML model for a flight and combine it with the stored database prediction."""
+    airline_name = _airline_name(flight.airline_id) or 'Unknown'
+    origin_code = flight.origin_airport.iata_code if flight.origin_airport else 'Unknown'
+    destination_code = flight.destination_airport.iata_code if flight.destination_airport else 'Unknown'
+    
+    # Prepare flight data for ML prediction
+    flight_data = {
+        'flight_number': flight.flight_number,
+        'airline': airline_name,
+        'aircraft_type': _aircraft_type(flight.aircraft_id) or 'Unknown',
+        'origin': origin_code,
+        'destination': destination_code,
+        'scheduled_departure': flight.scheduled_departure,
+        'actual_departure': flight.actual_departure,
+        'scheduled_arrival': flight.scheduled_arrival,
+        'actual_arrival': flight.actual_arrival,
+        'gate': flight.gate,
+        'terminal': flight.terminal,
+        'status': flight.status,
+        'delay_minutes': flight.delay_minutes or 0,
+        'seats_available': flight.seats_available,
+        'total_seats': flight.total_seats,
+        'on_time_probability': flight.on_time_probability,
+        'duration_minutes': flight.duration_minutes,
+        'distance_miles': flight.distance_miles,
+        'flight_date': flight.flight_date
+    }
+    
+    # Get ML prediction, batched with any other requests arriving at the same time
+    ml_prediction = _predict_delay_coalesced(flight_data)
+    
+    # Combine with database prediction
+    prediction = {
+        'flight_number': flight.flight_number,
+        'airline': airline_name,
+        'route': f"{origin_code} → {destination_code}",
+        'scheduled_departure': flight.scheduled_departure,
+        'current_status': flight.status,
+        'actual_delay_minutes': flight.delay_minutes or 0,
+        
+        # ML Predictions
+        'ml_predicted_delay_minutes': ml_prediction['predicted_delay_minutes'],
+        'ml_confidence_interval': ml_prediction['confidence_interval'],
+        'ml_prediction_quality': ml_prediction['prediction_quality'],
+        'ml_model_used': ml_prediction['model_used'],
+        
+        # Database Predictions (for comparison)
+        'db_on_time_probability': flight.on_time_probability or 0.5,
+        'db_delay_probability': flight.delay_probability or 0.3,
+        'db_cancellation_probability': flight.cancellation_probability or 0.05,
+        
+        # Combined Analysis
+        'recommendation': _get_flight_recommendation(ml_prediction, flight),
+        'risk_factors': _analyze_risk_factors(flight_data)
+    }
+    
+    return prediction
+
 def _get_flight_recommendation(ml_prediction: dict, flight: Flight) -> str:
     """Generate flight recommendation based on ML prediction and flight data."""
     predicted_delay = ml_prediction['predicted_delay_minutes']
@@ -236,6 +680,12 @@ def _get_flight_recommendation(ml_prediction: dict, flight: Flight) -> str:
     else:  # HIGH_RISK
         return "NOT RECOMMENDED - High delay risk"
 
+# Risk factor lookups, built once: departure hours as 24-bit masks (bit n = hour n)
+PEAK_HOURS_MASK = sum(1 << hour for hour in [*range(6, 10), *range(17, 21)])
+OFF_PEAK_HOURS_MASK = sum(1 << hour for hour in [*range(22, 24), *range(0, 6)])
+HIGH_DELAY_AIRLINES = frozenset({'United Airlines', 'American Airlines'})
+BUSY_ROUTES = frozenset({('LAX', 'JFK'), ('ORD', 'LAX'), ('ATL', 'LAX')})
+
 def _analyze_risk_factors(flight_data: dict) -> list:
     """Analyze risk factors for a flight."""
     risk_factors = []
@@ -245,22 +695,20 @@ def _analyze_risk_factors(flight_data: dict) -> list:
         departure_time = flight_data['scheduled_departure']
         if hasattr(departure_time, 'hour'):
             hour = departure_time.hour
-            if hour in range(6, 10) or hour in range(17, 21):
+            if (PEAK_HOURS_MASK >> hour) & 1:
                 risk_factors.append("Peak hour departure")
-            elif hour in range(22, 24) or hour in range(0, 6):
+            elif (OFF_PEAK_HOURS_MASK >> hour) & 1:
                 risk_factors.append("Off-peak departure")
     
     # Airline risks
     airline = flight_data.get('airline', '')
-    high_delay_airlines = ['United Airlines', 'American Airlines']
-    if airline in high_delay_airlines:
+    if airline in HIGH_DELAY_AIRLINES:
         risk_factors.append("Airline with higher delay rates")
     
     # Route risks
     origin = flight_data.get('origin', '')
     destination = flight_data.get('destination', '')
-    busy_routes = [('LAX', 'JFK'), ('ORD', 'LAX'), ('ATL', 'LAX')]
-    if (origin, destination) in busy_routes:
+    if (origin, destination) in BUSY_ROUTES:
         risk_factors.append("Busy route with higher congestion")
     
     # Capacity risks
@@ -272,6 +720,39 @@ def _analyze_risk_factors(flight_data: dict) -> list:
     
     return risk_factors
 
+# Rule-based fallback for /flights/status when the ML model fails, built once
+FALLBACK_AIRLINE_DELAYS = {
+    'Spirit Airlines': 25, 'Frontier Airlines': 22, 'JetBlue Airways': 18,
+    'American Airlines': 15, 'United Airlines': 16, 'Southwest Airlines': 14,
+    'Delta Air Lines': 12, 'Alaska Airlines': 10
+}
+FALLBACK_PEAK_HOURS = frozenset({7, 8, 17, 18, 19})
+FALLBACK_OFF_PEAK_HOURS = frozenset({22, 23, 0, 1, 2, 3, 4, 5})
+FALLBACK_WEATHER_DELAYS = {'clear': 0, 'cloudy': 5, 'rain': 15, 'storm': 30, 'fog': 20}
+
+# Simulated per-flight conditions for /flights/status until a live weather feed is wired in
+SIMULATED_WEATHER_CONDITIONS = ['clear', 'cloudy', 'rain', 'storm', 'fog']
+_simulation_rng = np.random.default_rng()
+
+# /flights/status only accepts plain YYYY-MM-DD dates (fromisoformat alone also takes week dates)
+ISO_DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+def _get_route_airports(from_airport: str, to_airport: str) -> tuple:
+    """Look up both route endpoints as airport dicts; missing airports come back as None."""
+    # Airports not cached yet (added since startup, or unknown) are fetched in one query
+    missing = [code for code in (from_airport, to_airport) if code not in _airports_by_iata]
+    if missing:
+        for airport in Airport.query.filter(Airport.iata_code.in_(missing)).all():
+            _airports_by_iata[airport.iata_code] = airport.to_dict()
+    return _airports_by_iata.get(from_airport), _airports_by_iata.get(to_airport)
+
+def _flight_status_response(body, etag):
+    """/flights/status body tagged with the route version it was built from"""
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.max_age = 30
+    return response
+
 @app.route('/flights/status')
 def get_flight_status():
     """Get flight status - Database-powered endpoint with comprehensive data"""
@@ -288,198 +769,244 @@ def get_flight_status():
     try:
         # Parse the requested date
         try:
-            request_date = datetime.strptime(date, '%Y-%m-%d').date()
+            if not ISO_DATE_PATTERN.fullmatch(date):
+                raise ValueError(date)
+            request_date = datetime.fromisoformat(date).date()
         except ValueError:
             return jsonify({'error': 'Invalid date format. Use YYYY-MM-DD'}), 400
         
-        with app.app_context():
-            # Get airports
-            origin_airport = Airport.query.filter_by(iata_code=from_airport).first()
-            destination_airport = Airport.query.filter_by(iata_code=to_airport).first()
-            
-            if not origin_airport or not destination_airport:
-                return jsonify({
-                    'flights': [],
-                    'lastUpdated': datetime.now(timezone.utc).isoformat(),
-                    'message': f'Airport not found: {from_airport} or {to_airport}'
-                })
-            
-            # Query flights from database
-            flights_query = Flight.query.filter(
-                and_(
-                    Flight.origin_airport_id == origin_airport.id,
-                    Flight.destination_airport_id == destination_airport.id,
-                    Flight.flight_date == request_date
-                )
-            ).options(
-                db.joinedload(Flight.airline),
-                db.joinedload(Flight.aircraft),
-                db.joinedload(Flight.origin_airport),
-                db.joinedload(Flight.destination_airport)
-            ).order_by(Flight.scheduled_departure)
-            
-            flights_db = flights_query.all()
-            
-            if not flights_db:
-                return jsonify({
-                    'flights': [],
-                    'lastUpdated': datetime.now(timezone.utc).isoformat(),
-                    'message': f'No flights found for {from_airport} to {to_airport} on {date}'
-                })
-            
-            # Convert to API format
-            flights = []
-            import random
-            weather_conditions = ['clear', 'cloudy', 'rain', 'storm', 'fog']
-            for flight in flights_db:
-                # Simulate weather and NAS features
-                flight_weather = random.choice(weather_conditions)
-                flight_nas_congestion = round(random.uniform(0.3, 0.95), 2)
-                airport_congestion = round(random.uniform(0.3, 0.98), 2)
-                # TODO: Use real weather/NAS/congestion API here instead of random values
-                # Prepare ML feature dict for per-flight prediction
-                # Calculate duration if not set
-                duration_mins = flight.duration_minutes
-                if not duration_mins and flight.scheduled_departure and flight.scheduled_arrival:
-                    duration_mins = int((flight.scheduled_arrival - flight.scheduled_departure).total_seconds() / 60)
-                if not duration_mins:
-                    duration_mins = 180  # Default 3 hours
+        # Get airports
+        origin_airport, destination_airport = _get_route_airports(from_airport, to_airport)
+        
+        if not origin_airport or not destination_airport:
+            return jsonify({
+                'flights': [],
+                'lastUpdated': _utc_now_isoformat(),
+                'message': f'Airport not found: {from_airport} or {to_airport}'
+            })
+        
+        route_filter = (
+            Flight.origin_airport_id == origin_airport['id'],
+            Flight.destination_airport_id == destination_airport['id'],
+            Flight.flight_date == request_date
+        )
+        
+        # The payload only changes with the route's flight rows and the loaded model,
+        # so a repeat request is answered from one small aggregate query
+        max_updated_at, route_flight_count = db.session.execute(
+            select(func.max(Flight.updated_at), func.count()).where(*route_filter)
+        ).one()
+        etag = _version_etag(
+            from_airport, to_airport, date, max_updated_at, route_flight_count,
+            ml_model_version, getattr(ml_predictor, 'best_model', None)
+        )
+        if _client_has_version(etag):
+            return _not_modified(etag)
+        
+        # Dashboards poll the same route; reuse the assembled body while the route is unchanged
+        cache_key = ('flight_status', etag)
+        entry = _response_cache.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            return _flight_status_response(entry[2], etag)
+        
+        # Query flights from database as plain row mappings; the handler only reads
+        # column values, so skip building ORM objects and instrumented attribute access
+        flights_query = select(
+            Flight.flight_number,
+            Flight.status,
+            Flight.scheduled_departure,
+            Flight.actual_departure,
+            Flight.scheduled_arrival,
+            Flight.actual_arrival,
+            Flight.gate,
+            Flight.terminal,
+            Flight.delay_minutes,
+            Flight.delay_percentage,
+            Flight.seats_available,
+            Flight.total_seats,
+            Flight.route_frequency,
+            Flight.duration_minutes,
+            Flight.distance_miles,
+            Flight.on_time_probability,
+            Flight.flight_date,
+            Flight.airline_id,
+            Flight.aircraft_id
+        ).where(*route_filter).order_by(Flight.scheduled_departure)
+        
+        flights_db = db.session.execute(flights_query).mappings().all()
+        
+        # Names come from the in-process reference caches instead of joined tables
+        airline_names = [_airline_name(flight['airline_id']) for flight in flights_db]
+        aircraft_types = [_aircraft_type(flight['aircraft_id']) for flight in flights_db]
+        
+        if not flights_db:
+            return jsonify({
+                'flights': [],
+                'lastUpdated': _utc_now_isoformat(),
+                'message': f'No flights found for {from_airport} to {to_airport} on {date}'
+            })
+        
+        # Build ML feature columns for every flight first so the model scores them in one call;
+        # one list per feature (struct of arrays) rather than a dict per flight
+        flight_count = len(flights_db)
+        # Simulate weather and NAS features for all flights with one generator call each
+        # TODO: Use real weather/NAS/congestion API here instead of random values
+        weather_by_flight = _simulation_rng.choice(SIMULATED_WEATHER_CONDITIONS, flight_count).tolist()
+        nas_congestion_levels = _simulation_rng.uniform(0.3, 0.95, flight_count).round(2).tolist()
+        airport_congestion_levels = _simulation_rng.uniform(0.3, 0.98, flight_count).round(2).tolist()
+        
+        # Calculate duration if not set, defaulting to 3 hours
+        durations = [
+            flight['duration_minutes']
+            or (int((flight['scheduled_arrival'] - flight['scheduled_departure']).total_seconds() / 60)
+                if flight['scheduled_departure'] and flight['scheduled_arrival'] else None)
+            or 180
+            for flight in flights_db
+        ]
+        
+        flights_data = {
+            'flight_number': [flight['flight_number'] for flight in flights_db],
+            'airline': [airline_name or 'Unknown' for airline_name in airline_names],
+            'aircraft_type': [aircraft_type or 'Unknown' for aircraft_type in aircraft_types],
+            'origin': [from_airport] * flight_count,
+            'destination': [to_airport] * flight_count,
+            'scheduled_departure': [flight['scheduled_departure'] for flight in flights_db],
+            'actual_departure': [flight['actual_departure'] for flight in flights_db],
+            'scheduled_arrival': [flight['scheduled_arrival'] for flight in flights_db],
+            'actual_arrival': [flight['actual_arrival'] for flight in flights_db],
+            'gate': [flight['gate'] for flight in flights_db],
+            'terminal': [flight['terminal'] for flight in flights_db],
+            'status': [flight['status'] for flight in flights_db],
+            'seats_available': [flight['seats_available'] or 0 for flight in flights_db],
+            'total_seats': [flight['total_seats'] or 180 for flight in flights_db],
+            'route_frequency': [flight['route_frequency'] or 0 for flight in flights_db],
+            'duration_minutes': durations,
+            'distance_miles': [flight['distance_miles'] or 1000 for flight in flights_db],
+            'delay_minutes': [flight['delay_minutes'] or 0 for flight in flights_db],  # Required by ML predictor
+            'on_time_probability': [flight['on_time_probability'] or 0.7 for flight in flights_db],
+            # Simulated and historic features - make these more varied per flight
+            'weather_condition': weather_by_flight,
+            'current_nas_congestion': nas_congestion_levels,
+            'current_airport_congestion': airport_congestion_levels,
+            # Add time-based features for better variation
+            'flight_date': [flight['flight_date'] for flight in flights_db],
+        }
+        
+        try:
+            ml_predictions = ml_predictor.predict_delay_batch(flights_data)
+        except Exception as e:
+            import logging
+            logging.warning(f"ML prediction failed for {from_airport} → {to_airport} on {date}: {str(e)}")
+            ml_predictions = [None] * flight_count
+        
+        # Predicted delay and risk category per flight
+        delay_minutes_preds = []
+        prediction_qualities = []
+        for flight, airline_name, flight_weather, flight_nas_congestion, airport_congestion, ml_prediction in zip(
+            flights_db, airline_names, weather_by_flight, nas_congestion_levels, airport_congestion_levels, ml_predictions
+        ):
+            if ml_prediction is not None:
+                delay_minutes_pred = max(0, ml_prediction['predicted_delay_minutes'])
+                prediction_quality = ml_prediction.get('prediction_quality', 'LOW_RISK')
+            else:
+                # Fallback: Calculate delay based on flight characteristics
+                # Calculate delay based on multiple factors for variation
+                base_delay = 5
                 
-                flight_data = {
-                    'flight_number': flight.flight_number,
-                    'airline': flight.airline.name if flight.airline else 'Unknown',
-                    'aircraft_type': flight.aircraft.type_code if flight.aircraft else 'Unknown',
-                    'origin': from_airport,
-                    'destination': to_airport,
-                    'scheduled_departure': flight.scheduled_departure,
-                    'actual_departure': flight.actual_departure,
-                    'scheduled_arrival': flight.scheduled_arrival,
-                    'actual_arrival': flight.actual_arrival,
-                    'gate': flight.gate,
-                    'terminal': flight.terminal,
-                    'status': flight.status,
-                    'seats_available': flight.seats_available or 0,
-                    'total_seats': flight.total_seats or 180,
-                    'route_frequency': flight.route_frequency or 0,
-                    'duration_minutes': duration_mins,
-                    'distance_miles': flight.distance_miles or 1000,
-                    'delay_minutes': flight.delay_minutes or 0,  # Required by ML predictor
-                    'on_time_probability': flight.on_time_probability or 0.7,
-                    # Simulated and historic features - make these more varied per flight
-                    'weather_condition': flight_weather,
-                    'current_nas_congestion': flight_nas_congestion,
-                    'current_airport_congestion': airport_congestion,
-                    # Add time-based features for better variation
-                    'flight_date': flight.flight_date,
-                }
-                try:
-                    ml_prediction = ml_predictor.predict_delay(flight_data)
-                    delay_minutes_pred = max(0, ml_prediction['predicted_delay_minutes'])
-                    prediction_quality = ml_prediction.get('prediction_quality', 'LOW_RISK')
-                except Exception as e:
-                    # Fallback: Calculate delay based on flight characteristics
-                    import logging
-                    logging.warning(f"ML prediction failed for flight {flight.flight_number}: {str(e)}")
-                    
-                    # Calculate delay based on multiple factors for variation
-                    base_delay = 5
-                    
-                    # Airline-specific base delays (if airline known)
-                    if flight.airline:
-                        airline_name = flight.airline.name
-                        airline_delays = {
-                            'Spirit Airlines': 25, 'Frontier Airlines': 22, 'JetBlue Airways': 18,
-                            'American Airlines': 15, 'United Airlines': 16, 'Southwest Airlines': 14,
-                            'Delta Air Lines': 12, 'Alaska Airlines': 10
-                        }
-                        base_delay += airline_delays.get(airline_name, 12)
-                    
-                    # Time of day factor
-                    if flight.scheduled_departure:
-                        hour = flight.scheduled_departure.hour
-                        if hour in [7, 8, 17, 18, 19]:  # Peak hours
-                            base_delay += 15
-                        elif hour in [22, 23, 0, 1, 2, 3, 4, 5]:  # Off-peak
-                            base_delay += 3
-                    
-                    # Weather factor
-                    weather_delays = {'clear': 0, 'cloudy': 5, 'rain': 15, 'storm': 30, 'fog': 20}
-                    base_delay += weather_delays.get(flight_weather, 5)
-                    
-                    # NAS congestion factor
-                    base_delay += int(flight_nas_congestion * 20)
-                    
-                    # Airport congestion factor
-                    base_delay += int(airport_congestion * 15)
-                    
-                    # Add some randomness for variation
-                    import random
-                    base_delay += random.randint(-5, 10)
-                    
-                    delay_minutes_pred = max(0, base_delay)
-                    
-                    # Determine risk category
-                    if delay_minutes_pred >= 60:
-                        prediction_quality = 'HIGH_RISK'
-                    elif delay_minutes_pred >= 30:
-                        prediction_quality = 'MEDIUM_RISK'
-                    else:
-                        prediction_quality = 'LOW_RISK'
+                # Airline-specific base delays (if airline known)
+                if airline_name:
+                    base_delay += FALLBACK_AIRLINE_DELAYS.get(airline_name, 12)
+                
+                # Time of day factor
+                if flight['scheduled_departure']:
+                    hour = flight['scheduled_departure'].hour
+                    if hour in FALLBACK_PEAK_HOURS:
+                        base_delay += 15
+                    elif hour in FALLBACK_OFF_PEAK_HOURS:
+                        base_delay += 3
+                
+                # Weather factor
+                base_delay += FALLBACK_WEATHER_DELAYS.get(flight_weather, 5)
+                
+                # NAS congestion factor
+                base_delay += int(flight_nas_congestion * 20)
+                
+                # Airport congestion factor
+                base_delay += int(airport_congestion * 15)
+                
+                # Add some randomness for variation
+                base_delay += int(_simulation_rng.integers(-5, 11))
+                
+                delay_minutes_pred = max(0, base_delay)
                 
-                # Calculate delay probability based on predicted delay minutes
-                # Probability that delay will be >= 15 minutes (meaningful delay)
+                # Determine risk category
                 if delay_minutes_pred >= 60:
-                    delay_probability = 0.85  # 85% chance of significant delay
+                    prediction_quality = 'HIGH_RISK'
                 elif delay_minutes_pred >= 30:
-                    delay_probability = 0.65  # 65% chance
-                elif delay_minutes_pred >= 15:
-                    delay_probability = 0.45  # 45% chance
-                elif delay_minutes_pred >= 5:
-                    delay_probability = 0.25  # 25% chance
+                    prediction_quality = 'MEDIUM_RISK'
                 else:
-                    delay_probability = 0.10  # 10% chance (low but not zero)
-                
-                # Map prediction quality to delay risk
-                if 'HIGH' in prediction_quality:
-                    delay_risk = 'HIGH'
-                elif 'MEDIUM' in prediction_quality:
-                    delay_risk = 'MEDIUM'
-                else:
-                    delay_risk = 'LOW'
-                # Convert to API format as before, but using the new prediction fields:
-                flights.append({
-                    "flightNumber": flight.flight_number,
-                    "airline": flight.airline.name if flight.airline else "Unknown",
-                    "aircraftType": flight.aircraft.type_code if flight.aircraft else "Unknown",
-                    "from": from_airport,
-                    "to": to_airport,
-                    "schedDep": flight.scheduled_departure.isoformat() if flight.scheduled_departure else None,
-                    "estDep": flight.actual_departure.isoformat() if flight.actual_departure else None,
-                    "schedArr": flight.scheduled_arrival.isoformat() if flight.scheduled_arrival else None,
-                    "estArr": flight.actual_arrival.isoformat() if flight.actual_arrival else None,
-                    "gate": flight.gate or "TBD",
-                    "terminal": flight.terminal or "TBD",
-                    "status": flight.status,
-                    "delayMinutes": flight.delay_minutes if flight.delay_minutes and flight.delay_minutes > 0 else None,
-                    "delayPercentage": flight.delay_percentage,
-                    "seatsAvailable": flight.seats_available or 0,
-                    "totalSeats": flight.total_seats,
-                    # Add prediction fields:
-                    "delayProbability": delay_probability,
-                    "predictedDelayMinutes": delay_minutes_pred,
-                    "delayRisk": delay_risk,
-                })
+                    prediction_quality = 'LOW_RISK'
             
-            return jsonify({
-                "flights": flights,
-                "lastUpdated": datetime.now(timezone.utc).isoformat(),
-                "totalFlights": len(flights),
-                "route": f"{from_airport} → {to_airport}",
-                "date": date,
-                "originAirport": origin_airport.to_dict(),
-                "destinationAirport": destination_airport.to_dict()
+            delay_minutes_preds.append(delay_minutes_pred)
+            prediction_qualities.append(prediction_quality)
+        
+        # Calculate delay probability based on predicted delay minutes, for all flights at once
+        # Probability that delay will be >= 15 minutes (meaningful delay)
+        predicted = np.array(delay_minutes_preds, dtype=float)
+        delay_probabilities = np.select(
+            [predicted >= 60, predicted >= 30, predicted >= 15, predicted >= 5],
+            [0.85, 0.65, 0.45, 0.25],  # 85% chance of significant delay down to 25%
+            default=0.10  # 10% chance (low but not zero)
+        ).tolist()
+        
+        # Map prediction quality to delay risk
+        qualities = np.array(prediction_qualities, dtype=str)
+        delay_risks = np.select(
+            [np.char.find(qualities, 'HIGH') >= 0, np.char.find(qualities, 'MEDIUM') >= 0],
+            ['HIGH', 'MEDIUM'],
+            default='LOW'
+        ).tolist()
+        
+        # Convert to API format
+        flights = []
+        for flight, airline_name, aircraft_type, delay_minutes_pred, delay_probability, delay_risk in zip(
+            flights_db, airline_names, aircraft_types, delay_minutes_preds, delay_probabilities, delay_risks
+        ):
+            # Convert to API format as before, but using the new prediction fields:
+            flights.append({
+                "flightNumber": flight["flight_number"],
+                "airline": airline_name or "Unknown",
+                "aircraftType": aircraft_type or "Unknown",
+                "from": from_airport,
+                "to": to_airport,
+                "schedDep": flight["scheduled_departure"],
+                "estDep": flight["actual_departure"],
+                "schedArr": flight["scheduled_arrival"],
+                "estArr": flight["actual_arrival"],
+                "gate": flight["gate"] or "TBD",
+                "terminal": flight["terminal"] or "TBD",
+                "status": flight["status"],
+                "delayMinutes": flight["delay_minutes"] if flight["delay_minutes"] and flight["delay_minutes"] > 0 else None,
+                "delayPercentage": flight["delay_percentage"],
+                "seatsAvailable": flight["seats_available"] or 0,
+                "totalSeats": flight["total_seats"],
+                # Add prediction fields:
+                "delayProbability": delay_probability,
+                "predictedDelayMinutes": delay_minutes_pred,
+                "delayRisk": delay_risk,
             })
         
+        _, _, body = _store_json_body(cache_key, FLIGHT_STATUS_CACHE_TTL, {
+            "flights": flights,
+            "lastUpdated": _utc_now_isoformat(),
+            "totalFlights": len(flights),
+            "route": f"{from_airport} → {to_airport}",
+            "date": date,
+            "originAirport": origin_airport,
+            "destinationAirport": destination_airport
+        }, etag=etag)
+        return _flight_status_response(body, etag)
+        
     except Exception as e:
         return jsonify({'error': f'Failed to fetch flights: {str(e)}'}), 500
 
@@ -496,80 +1023,80 @@ def get_delay_analysis():
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
     
     try:
-        with app.app_context():
-            # Get origin and destination airports
-            origin_airport = Airport.query.filter_by(iata_code=from_airport).first()
-            destination_airport = Airport.query.filter_by(iata_code=to_airport).first()
-            
-            if not origin_airport or not destination_airport:
-                return jsonify({'error': f'Airport not found: {from_airport} or {to_airport}'}), 404
-            
-            # Get flights for analysis
-            flights = Flight.query.filter(
-                and_(
-                    Flight.origin_airport_id == origin_airport.id,
-                    Flight.destination_airport_id == destination_airport.id,
-                    Flight.primary_delay_reason.isnot(None)
-                )
-            ).options(
-                db.joinedload(Flight.airline),
-                db.joinedload(Flight.aircraft)
-            ).all()
-            
-            if not flights:
-                return jsonify({
-                    'delay_analysis': {
-                        'total_flights': 0,
-                        'delayed_flights': 0,
-                        'delay_percentage': 0,
-                        'primary_reasons': {},
-                        'average_delay_minutes': 0,
-                        'confidence_score': 0
-                    }
-                })
-            
-            # Analyze delay patterns
-            delay_reasons = {}
-            total_delays = 0
-            total_delay_minutes = 0
-            confidence_scores = []
-            
-            for flight in flights:
-                if flight.delay_minutes and flight.delay_minutes > 0:
-                    total_delays += 1
-                    total_delay_minutes += flight.delay_minutes
-                    
-                    reason = flight.primary_delay_reason
-                    if reason:
-                        delay_reasons[reason] = delay_reasons.get(reason, 0) + 1
-                    
-                    if flight.delay_reason_confidence:
-                        confidence_scores.append(flight.delay_reason_confidence)
-            
-            # Calculate statistics
-            total_flights = len(flights)
-            delay_percentage = (total_delays / total_flights) * 100 if total_flights > 0 else 0
-            average_delay_minutes = total_delay_minutes / total_delays if total_delays > 0 else 0
-            average_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0
-            
-            # Convert counts to percentages
-            reason_percentages = {}
-            for reason, count in delay_reasons.items():
-                reason_percentages[reason] = (count / total_delays) * 100 if total_delays > 0 else 0
-            
+        # Get origin and destination airports
+        origin_airport, destination_airport = _get_route_airports(from_airport, to_airport)
+        
+        if not origin_airport or not destination_airport:
+            return jsonify({'error': f'Airport not found: {from_airport} or {to_airport}'}), 404
+        
+        route_filter = (
+            Flight.origin_airport_id == origin_airport['id'],
+            Flight.destination_airport_id == destination_airport['id'],
+            Flight.primary_delay_reason.isnot(None)
+        )
+        
+        # Count flights for analysis in SQL rather than loading them
+        total_flights = db.session.execute(
+            select(func.count()).select_from(Flight).where(*route_filter)
+        ).scalar()
+        
+        if not total_flights:
             return jsonify({
                 'delay_analysis': {
-                    'total_flights': total_flights,
-                    'delayed_flights': total_delays,
-                    'delay_percentage': round(delay_percentage, 1),
-                    'primary_reasons': reason_percentages,
-                    'average_delay_minutes': round(average_delay_minutes, 1),
-                    'confidence_score': round(average_confidence, 2),
-                    'route': f"{from_airport} → {to_airport}",
-                    'last_updated': datetime.now(timezone.utc).isoformat()
+                    'total_flights': 0,
+                    'delayed_flights': 0,
+                    'delay_percentage': 0,
+                    'primary_reasons': {},
+                    'average_delay_minutes': 0,
+                    'confidence_score': 0
                 }
             })
         
+        # Analyze delay patterns with one grouped aggregate over the delayed flights;
+        # zero confidences are skipped like missing ones
+        confidence = func.nullif(Flight.delay_reason_confidence, 0)
+        reason_rows = db.session.execute(
+            select(
+                Flight.primary_delay_reason,
+                func.count().label('delayed_flights'),
+                func.sum(Flight.delay_minutes).label('delay_minutes'),
+                func.sum(confidence).label('confidence_total'),
+                func.count(confidence).label('confidence_count')
+            ).where(
+                *route_filter,
+                Flight.delay_minutes > 0
+            ).group_by(Flight.primary_delay_reason)
+        ).all()
+        
+        total_delays = sum(row.delayed_flights for row in reason_rows)
+        total_delay_minutes = sum(row.delay_minutes for row in reason_rows)
+        confidence_total = sum(row.confidence_total or 0 for row in reason_rows)
+        confidence_count = sum(row.confidence_count for row in reason_rows)
+        
+        # Calculate statistics
+        delay_percentage = (total_delays / total_flights) * 100 if total_flights > 0 else 0
+        average_delay_minutes = total_delay_minutes / total_delays if total_delays > 0 else 0
+        average_confidence = confidence_total / confidence_count if confidence_count else 0
+        
+        # Convert counts to percentages
+        reason_percentages = {
+            row.primary_delay_reason: (row.delayed_flights / total_delays) * 100
+            for row in reason_rows
+        }
+        
+        return jsonify({
+            'delay_analysis': {
+                'total_flights': total_flights,
+                'delayed_flights': total_delays,
+                'delay_percentage': round(delay_percentage, 1),
+                'primary_reasons': reason_percentages,
+                'average_delay_minutes': round(average_delay_minutes, 1),
+                'confidence_score': round(average_confidence, 2),
+                'route': f"{from_airport} → {to_airport}",
+                'last_updated': _utc_now_isoformat()
+            }
+        })
+        
     except Exception as e:
         return jsonify({'error': f'Error analyzing delays: {str(e)}'}), 500
 
@@ -587,25 +1114,26 @@ def get_monthly_airline_performance():
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
     
     try:
-        with app.app_context():
+        # Filter by airline if specified (unknown codes are ignored)
+        airline = Airline.query.filter_by(iata_code=airline_code).first() if airline_code else None
+        airline_id = airline.id if airline else None
+        
+        def build_payload():
             # Build query
             query = AirlineMonthlyPerformance.query.filter(
                 AirlineMonthlyPerformance.year == year,
                 AirlineMonthlyPerformance.month == month
             )
+            if airline_id is not None:
+                query = query.filter(AirlineMonthlyPerformance.airline_id == airline_id)
             
-            # Filter by airline if specified
-            if airline_code:
-                airline = Airline.query.filter_by(iata_code=airline_code).first()
-                if airline:
-                    query = query.filter(AirlineMonthlyPerformance.airline_id == airline.id)
-            
-            performances = query.options(
+            performances = query.options(*_load_options(
                 db.joinedload(AirlineMonthlyPerformance.airline),
                 db.joinedload(AirlineMonthlyPerformance.airport)
-            ).all()
+            )).all()
             
             if not performances:
+                # Sent as a Response so it is not cached: the month's data may still be imported
                 return jsonify({
                     'performances': [],
                     'message': f'No data found for {year}-{month:02d}' + (f' (airline: {airline_code})' if airline_code else '')
@@ -613,16 +1141,38 @@ def get_monthly_airline_performance():
             
             performances_list = [perf.to_dict() for perf in performances]
             
-            return jsonify({
+            return {
                 'performances': performances_list,
                 'year': year,
                 'month': month,
                 'total_records': len(performances_list)
-            })
-            
+            }
+        
+        # Completed months are final, so their figures are cached
+        if _is_past_month(year, month):
+            return _cached_json_response(('monthly_performance', year, month, airline_id), MONTHLY_PERFORMANCE_CACHE_TTL, build_payload)
+        return build_payload()
+        
     except Exception as e:
         return jsonify({'error': f'Failed to fetch performance data: {str(e)}'}), 500
 
+# AirlineMonthlyPerformance columns read when predicting from past months
+MONTHLY_HISTORY_COLUMNS = (
+    AirlineMonthlyPerformance.year,
+    AirlineMonthlyPerformance.month,
+    AirlineMonthlyPerformance.total_arrivals,
+    AirlineMonthlyPerformance.arrivals_delayed_15_min,
+    AirlineMonthlyPerformance.cancellations,
+    AirlineMonthlyPerformance.on_time_percentage,
+    AirlineMonthlyPerformance.completion_factor,
+    AirlineMonthlyPerformance.total_delay_minutes,
+    AirlineMonthlyPerformance.carrier_delay_minutes,
+    AirlineMonthlyPerformance.weather_delay_minutes,
+    AirlineMonthlyPerformance.nas_delay_minutes,
+    AirlineMonthlyPerformance.late_aircraft_delay_minutes,
+    AirlineMonthlyPerformance.security_delay_minutes
+)
+
 @app.route('/api/airline-performance/predict')
 def predict_monthly_delay():
     """Get performance metrics for a given airline and month based on historical data"""
@@ -637,12 +1187,12 @@ def predict_monthly_delay():
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
     
     try:
-        with app.app_context():
-            # Get airline
-            airline = Airline.query.filter_by(iata_code=airline_code).first()
-            if not airline:
-                return jsonify({'error': f'Airline not found: {airline_code}'}), 404
-            
+        # Get airline
+        airline = Airline.query.filter_by(iata_code=airline_code).first()
+        if not airline:
+            return jsonify({'error': f'Airline not found: {airline_code}'}), 404
+        
+        def build_payload():
             # Determine if this is historical or future data
             # Historical data cutoff: Before 2026
             is_historical = year < 2026
@@ -672,7 +1222,7 @@ def predict_monthly_delay():
                     avg_delay_minutes = (actual_data.total_delay_minutes or 0) / max(actual_data.total_arrivals or 1, 1)
                 delay_duration_category = "LOW" if avg_delay_minutes < 30 else ("MEDIUM" if avg_delay_minutes < 60 else "HIGH")
                 
-                return jsonify({
+                return {
                     'airline': {
                         'code': airline.iata_code,
                         'name': airline.name
@@ -709,29 +1259,32 @@ def predict_monthly_delay():
                             'completion_factor': actual_data.completion_factor
                         }
                     }
-                })
+                }
             
             # Get historical performance data for prediction
             # Priority 1: Same month from previous years (seasonal patterns)
-            same_month_data = AirlineMonthlyPerformance.query.filter(
-                AirlineMonthlyPerformance.airline_id == airline.id,
-                AirlineMonthlyPerformance.month == month,
-                AirlineMonthlyPerformance.year < year  # Only past years
-            ).order_by(
-                AirlineMonthlyPerformance.year.desc()
-            ).limit(5).all()
+            # (only the columns the prediction reads, as plain rows)
+            same_month_data = db.session.execute(
+                select(*MONTHLY_HISTORY_COLUMNS).where(
+                    AirlineMonthlyPerformance.airline_id == airline.id,
+                    AirlineMonthlyPerformance.month == month,
+                    AirlineMonthlyPerformance.year < year  # Only past years
+                ).order_by(
+                    AirlineMonthlyPerformance.year.desc()
+                ).limit(5)
+            ).all()
             
             # Priority 2: Recent months from same airline (if same month data limited)
-            recent_data = AirlineMonthlyPerformance.query.filter(
-                AirlineMonthlyPerformance.airline_id == airline.id,
-                AirlineMonthlyPerformance.year < year
-            ).order_by(
-                AirlineMonthlyPerformance.year.desc(),
-                AirlineMonthlyPerformance.month.desc()
-            ).limit(12).all()
-            
             # Use same-month data if available, otherwise use recent data
-            historical_data = same_month_data if same_month_data else recent_data
+            historical_data = same_month_data or db.session.execute(
+                select(*MONTHLY_HISTORY_COLUMNS).where(
+                    AirlineMonthlyPerformance.airline_id == airline.id,
+                    AirlineMonthlyPerformance.year < year
+                ).order_by(
+                    AirlineMonthlyPerformance.year.desc(),
+                    AirlineMonthlyPerformance.month.desc()
+                ).limit(12)
+            ).all()
             
             if not historical_data:
                 return jsonify({'error': f'No historical data found for airline: {airline_code}'}), 404
@@ -843,8 +1396,13 @@ def predict_monthly_delay():
                 }
             }
             
-            return jsonify(prediction)
-            
+            return prediction
+        
+        # Completed months are final, so their prediction is cached
+        if _is_past_month(year, month):
+            return _cached_json_response(('monthly_prediction', year, month, airline.id), MONTHLY_PERFORMANCE_CACHE_TTL, build_payload)
+        return build_payload()
+        
     except Exception as e:
         return jsonify({'error': f'Failed to generate prediction: {str(e)}'}), 500
 
@@ -855,19 +1413,18 @@ def get_airlines():
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
     
     try:
-        with app.app_context():
-            # Get airlines that have performance data
-            airlines_with_data = db.session.query(Airline).join(
-                AirlineMonthlyPerformance
-            ).distinct().all()
-            
-            airlines_list = [airline.to_dict() for airline in airlines_with_data]
-            
-            return jsonify({
-                'airlines': airlines_list,
-                'total': len(airlines_list)
-            })
-            
+        # Get airlines that have performance data
+        airlines_with_data = db.session.query(Airline).join(
+            AirlineMonthlyPerformance
+        ).distinct().all()
+        
+        airlines_list = [airline.to_dict() for airline in airlines_with_data]
+        
+        return jsonify({
+            'airlines': airlines_list,
+            'total': len(airlines_list)
+        })
+        
     except Exception as e:
         return jsonify({'error': f'Failed to fetch airlines: {str(e)}'}), 500
 
@@ -878,30 +1435,29 @@ def get_available_months():
         return jsonify({'error': 'Database not initialized. Please run init_db.py first.'}), 500
     
     try:
-        with app.app_context():
-            periods = db.session.query(
-                AirlineMonthlyPerformance.year,
-                AirlineMonthlyPerformance.month
-            ).distinct().order_by(
-                AirlineMonthlyPerformance.year.desc(),
-                AirlineMonthlyPerformance.month.desc()
-            ).all()
-            
-            periods_list = [
-                {
-                    'year': year,
-                    'month': month,
-                    'label': f"{year}-{month:02d}",
-                    'month_name': datetime(year, month, 1).strftime('%B %Y')
-                }
-                for year, month in periods
-            ]
-            
-            return jsonify({
-                'periods': periods_list,
-                'total': len(periods_list)
-            })
-            
+        periods = db.session.query(
+            AirlineMonthlyPerformance.year,
+            AirlineMonthlyPerformance.month
+        ).distinct().order_by(
+            AirlineMonthlyPerformance.year.desc(),
+            AirlineMonthlyPerformance.month.desc()
+        ).all()
+        
+        periods_list = [
+            {
+                'year': year,
+                'month': month,
+                'label': f"{year}-{month:02d}",
+                'month_name': datetime(year, month, 1).strftime('%B %Y')
+            }
+            for year, month in periods
+        ]
+        
+        return jsonify({
+            'periods': periods_list,
+            'total': len(periods_list)
+        })
+        
     except Exception as e:
         return jsonify({'error': f'Failed to fetch available months: {str(e)}'}), 500
 
@@ -66,6 +66,48 @@ def migrate_database():
         
         conn.commit()
         
+        # Indexes declared on Flight.__table_args__; create_all() skips existing tables
+        new_indexes = [
+            ('idx_flight_airline', 'airline_id'),
+            ('idx_flight_destination', 'destination_airport_id'),
+            ('idx_flight_number_date', 'flight_number, flight_date'),
+            ('idx_flight_route_date_departure', 'origin_airport_id, destination_airport_id, flight_date, scheduled_departure'),
+            ('idx_flight_route_reason', 'origin_airport_id, destination_airport_id, primary_delay_reason')
+        ]
+        
+        # Indexes superseded by a wider one above (flight_number's column index by idx_flight_number_date)
+        replaced_indexes = ['idx_flight_route_date', 'ix_flights_flight_number']
+        
+        for index_name in replaced_indexes:
+            try:
+                cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+                print(f"✅ Dropped replaced index: {index_name}")
+            except sqlite3.Error as e:
+                print(f"❌ Error dropping index {index_name}: {e}")
+        
+        for index_name, index_columns in new_indexes:
+            try:
+                cursor.execute(f"CREATE INDEX IF NOT EXISTS {index_name} ON flights ({index_columns})")
+                print(f"✅ Ensured index: {index_name}")
+            except sqlite3.Error as e:
+                print(f"❌ Error creating index {index_name}: {e}")
+        
+        conn.commit()
+        
+        # Confirm the API's route queries are served by the indexes above
+        route_queries = [
+            ('/flights/status', "SELECT * FROM flights WHERE origin_airport_id = 1 AND destination_airport_id = 2 "
+                                "AND flight_date = '2025-01-01' ORDER BY scheduled_departure"),
+            ('/flights/delay-analysis', "SELECT primary_delay_reason, count(*) FROM flights WHERE origin_airport_id = 1 "
+                                        "AND destination_airport_id = 2 AND primary_delay_reason IS NOT NULL "
+                                        "AND delay_minutes > 0 GROUP BY primary_delay_reason")
+        ]
+        cursor.execute("ANALYZE flights")
+        for endpoint, query in route_queries:
+            cursor.execute(f"EXPLAIN QUERY PLAN {query}")
+            plan = '; '.join(row[3] for row in cursor.fetchall())
+            print(f"🔎 {endpoint}: {plan}")
+        
         # Update existing records with default values
         if added_count > 0:
             print("🔄 Updating existing records with default values...")
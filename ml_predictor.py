@@ -15,11 +15,15 @@ from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn.metrics import mean_squared_error, r2_score, mean_absolute_error
 import joblib
 import os
+import re
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Optional
 import warnings
 warnings.filterwarnings('ignore')
 
+# Leading gate number, as extract_features pulls it out with str.extract
+GATE_NUMBER_RE = re.compile(r'(\d+)')
+
 class FlightDelayPredictor:
     """
     Machine Learning model for predicting flight delays using multiple algorithms.
@@ -298,6 +302,221 @@ class FlightDelayPredictor:
         Returns:
             Dictionary with prediction results
         """
+        model = self._select_prediction_model()
+        
+        # Build the single input row directly rather than through a one-row DataFrame
+        X = self._single_flight_features(flight_data).reshape(1, -1)
+        
+        # Scale features
+        if 'standard' in self.scalers:
+            X_scaled = self.scalers['standard'].transform(X)
+        else:
+            X_scaled = X
+        
+        # Make prediction
+        predicted_delay = model.predict(X_scaled)[0]
+        
+        return {
+            'predicted_delay_minutes': max(0, predicted_delay),
+            'confidence_interval': self._get_confidence_interval(),
+            'model_used': self.best_model,
+            'prediction_quality': self._get_prediction_quality(predicted_delay)
+        }
+    
+    def predict_delay_batch(self, flights: List[Dict]) -> List[Dict[str, float]]:
+        """
+        Predict delays for many flights with a single model call.
+        
+        Args:
+            flights: List of flight dictionaries, as passed to predict_delay,
+                or a dictionary of equal-length feature columns
+            
+        Returns:
+            List of prediction results in the same order as flights
+        """
+        if not flights:
+            return []
+        
+        model = self._select_prediction_model()
+        
+        df = pd.DataFrame(flights)
+        
+        # extract_features refits the label encoders on its input; keep the
+        # trained encoders for the lookups below
+        label_encoders = dict(self.label_encoders)
+        df_features = self.extract_features(df)
+        self.label_encoders = label_encoders
+        
+        # Features extract_features derives across rows (aggregates, the terminal
+        # encoding) take the values a single-flight prediction gives them
+        if 'delay_minutes' in df.columns:
+            delay_minutes = df['delay_minutes'].fillna(0).to_numpy()
+            for col in ['airline_avg_delay', 'route_avg_delay']:
+                if col in df_features.columns:
+                    df_features[col] = delay_minutes
+            for col in ['airline_delay_std', 'route_delay_std']:
+                if col in df_features.columns:
+                    df_features[col] = 0.0
+        if 'route_frequency' in df_features.columns:
+            df_features['route_frequency'] = 1
+        if 'terminal_encoded' in df_features.columns:
+            df_features['terminal_encoded'] = 0
+        
+        # Apply stored label encoders; unseen labels encode as 0
+        encoded_columns = {
+            'airline': 'airline_encoded',
+            'aircraft_type': 'aircraft_type_encoded',
+            'origin': 'origin_encoded',
+            'destination': 'destination_encoded',
+        }
+        for col, encoded_col in encoded_columns.items():
+            if col in df.columns and col in self.label_encoders:
+                codes = {label: code for code, label in enumerate(self.label_encoders[col].classes_)}
+                df_features[encoded_col] = df[col].astype(str).map(codes).fillna(0).to_numpy()
+        
+        # Ensure all required features are present
+        X = df_features.reindex(columns=self.feature_columns, fill_value=0).fillna(0)
+        
+        # Scale features
+        if 'standard' in self.scalers:
+            X_scaled = self.scalers['standard'].transform(X)
+        else:
+            X_scaled = X.values
+        
+        # One vectorized predict for the whole batch
+        predicted_delays = model.predict(X_scaled)
+        confidence_interval = self._get_confidence_interval()
+        
+        return [
+            {
+                'predicted_delay_minutes': max(0, predicted_delay),
+                'confidence_interval': confidence_interval,
+                'model_used': self.best_model,
+                'prediction_quality': self._get_prediction_quality(predicted_delay)
+            }
+            for predicted_delay in predicted_delays
+        ]
+    
+    def predict_delay_many(self, flights: List[Dict]) -> List[Dict[str, float]]:
+        """
+        Predict delays for a few unrelated flights with a single model call.
+        
+        Each row is built exactly as in predict_delay, which keeps small batches
+        (such as coalesced API requests) cheaper than predict_delay_batch.
+        
+        Args:
+            flights: List of flight dictionaries, as passed to predict_delay
+            
+        Returns:
+            List of prediction results in the same order as flights
+        """
+        if not flights:
+            return []
+        
+        model = self._select_prediction_model()
+        
+        X = np.vstack([self._single_flight_features(flight_data) for flight_data in flights])
+        
+        # Scale features
+        if 'standard' in self.scalers:
+            X_scaled = self.scalers['standard'].transform(X)
+        else:
+            X_scaled = X
+        
+        predicted_delays = model.predict(X_scaled)
+        confidence_interval = self._get_confidence_interval()
+        
+        return [
+            {
+                'predicted_delay_minutes': max(0, predicted_delay),
+                'confidence_interval': confidence_interval,
+                'model_used': self.best_model,
+                'prediction_quality': self._get_prediction_quality(predicted_delay)
+            }
+            for predicted_delay in predicted_delays
+        ]
+    
+    def _single_flight_features(self, flight_data: Dict) -> np.ndarray:
+        """
+        Build the model input vector for one flight without a DataFrame.
+        
+        Produces what extract_features gives a one-row frame: airline and
+        route aggregates reduce to the flight's own delay, per-call label
+        fits encode as 0, and stored label encoders map known labels.
+        
+        Args:
+            flight_data: Dictionary containing flight information
+            
+        Returns:
+            Float array ordered like self.feature_columns
+        """
+        features = dict(flight_data)
+        
+        # Time-based features; a missing or unparseable departure leaves them at 0
+        if 'scheduled_departure' in flight_data:
+            departure = pd.to_datetime(flight_data['scheduled_departure'], errors='coerce')
+            if not pd.isna(departure):
+                hour = departure.hour
+                features['departure_hour'] = hour
+                features['departure_minute'] = departure.minute
+                features['departure_day_of_week'] = departure.dayofweek
+                features['departure_month'] = departure.month
+                features['departure_is_weekend'] = int(departure.dayofweek >= 5)
+                features['departure_is_peak'] = int(6 <= hour <= 9 or 17 <= hour <= 20)
+                features['departure_is_off_peak'] = int(4 <= hour <= 6 or hour >= 22 or hour <= 4)
+            
+            if 'scheduled_arrival' in flight_data:
+                arrival = pd.to_datetime(flight_data['scheduled_arrival'], errors='coerce')
+                features['scheduled_duration_minutes'] = (arrival - departure).total_seconds() / 60
+        
+        # Label-encoded categories: the stored encoder's code, else 0
+        for col in ['aircraft_type', 'airline', 'origin', 'destination']:
+            if col in flight_data:
+                code = 0
+                if col in self.label_encoders:
+                    classes = self.label_encoders[col].classes_
+                    label = str(flight_data[col])
+                    index = np.searchsorted(classes, label)
+                    if index < len(classes) and classes[index] == label:
+                        code = int(index)
+                features[f'{col}_encoded'] = code
+        
+        has_route = 'origin' in flight_data and 'destination' in flight_data
+        if has_route:
+            features['route_frequency'] = 1
+        
+        # Historical aggregates over a single flight are its own delay
+        if 'delay_minutes' in flight_data:
+            delay_minutes = flight_data['delay_minutes']
+            if 'airline' in flight_data:
+                features['airline_avg_delay'] = delay_minutes
+                features['airline_delay_std'] = 0
+            if has_route:
+                features['route_avg_delay'] = delay_minutes
+                features['route_delay_std'] = 0
+        
+        # Seat capacity features
+        seats_available = flight_data.get('seats_available')
+        if 'seats_available' in flight_data and 'total_seats' in flight_data:
+            total_seats = flight_data['total_seats']
+            if seats_available is not None and total_seats is not None:
+                features['load_factor'] = 1 - seats_available / (total_seats or 1)
+            else:
+                features['load_factor'] = None
+        elif 'seats_available' in flight_data and seats_available is not None:
+            features['estimated_load_factor'] = min(max(1 - seats_available / 200, 0), 1)
+        
+        # Gate features (terminal congestion proxy)
+        if 'gate' in flight_data:
+            gate_match = GATE_NUMBER_RE.search(flight_data['gate']) if isinstance(flight_data['gate'], str) else None
+            features['gate_number'] = float(gate_match.group(1)) if gate_match else None
+            features['terminal_encoded'] = 0
+        
+        X = np.array([features.get(col, 0) for col in self.feature_columns], dtype=float)
+        return np.nan_to_num(X, nan=0.0)
+    
+    def _select_prediction_model(self):
+        """Return the model used for predictions, falling back to defaults when untrained."""
         if not hasattr(self, 'best_model') or not self.best_model or self.best_model not in self.models:
             # Try to use any available model if best_model is not set
             available_models = [name for name, model in self.models.items() if model is not None]
@@ -306,12 +525,6 @@ class FlightDelayPredictor:
             self.best_model = available_models[0]
             print(f"Using {self.best_model} as default model")
         
-        # Convert to DataFrame for feature extraction
-        df = pd.DataFrame([flight_data])
-        
-        # Extract features (this will create feature columns)
-        df_features = self.extract_features(df)
-        
         # Use stored feature columns if available
         if not hasattr(self, 'feature_columns') or not self.feature_columns:
             # Fallback: define basic feature columns
@@ -322,63 +535,16 @@ class FlightDelayPredictor:
                 'origin_encoded', 'destination_encoded', 'route_frequency'
             ]
         
-        # Apply stored label encoders if available
-        if hasattr(self, 'label_encoders') and self.label_encoders:
-            if 'airline' in df.columns and 'airline' in self.label_encoders:
-                try:
-                    df_features['airline_encoded'] = self.label_encoders['airline'].transform(df['airline'].astype(str))
-                except:
-                    df_features['airline_encoded'] = 0
-            if 'aircraft_type' in df.columns and 'aircraft_type' in self.label_encoders:
-                try:
-                    df_features['aircraft_type_encoded'] = self.label_encoders['aircraft_type'].transform(df['aircraft_type'].astype(str))
-                except:
-                    df_features['aircraft_type_encoded'] = 0
-            if 'origin' in df.columns and 'origin' in self.label_encoders:
-                try:
-                    df_features['origin_encoded'] = self.label_encoders['origin'].transform(df['origin'].astype(str))
-                except:
-                    df_features['origin_encoded'] = 0
-            if 'destination' in df.columns and 'destination' in self.label_encoders:
-                try:
-                    df_features['destination_encoded'] = self.label_encoders['destination'].transform(df['destination'].astype(str))
-                except:
-                    df_features['destination_encoded'] = 0
-        
-        # Ensure all required features are present
-        X = pd.DataFrame()
-        for col in self.feature_columns:
-            if col in df_features.columns:
-                X[col] = df_features[col]
-            else:
-                X[col] = 0
-        
-        X = X.fillna(0)
-        
-        # Scale features
-        if 'standard' in self.scalers:
-            X_scaled = self.scalers['standard'].transform(X)
-        else:
-            X_scaled = X.values
-        
-        # Make prediction
-        model = self.models[self.best_model]
-        predicted_delay = model.predict(X_scaled)[0]
-        
-        # Get confidence interval (approximate)
+        return self.models[self.best_model]
+    
+    def _get_confidence_interval(self) -> float:
+        """Approximate 95% confidence interval half-width for the best model."""
         if hasattr(self, 'training_results') and self.training_results:
             std_error = np.sqrt(self.training_results.get(self.best_model, {}).get('test_mse', 100))
         else:
             # Default confidence interval if no training results available
             std_error = 10.0
-        confidence_interval = 1.96 * std_error  # 95% confidence
-        
-        return {
-            'predicted_delay_minutes': max(0, predicted_delay),
-            'confidence_interval': confidence_interval,
-            'model_used': self.best_model,
-            'prediction_quality': self._get_prediction_quality(predicted_delay)
-        }
+        return 1.96 * std_error  # 95% confidence
     
     def _get_prediction_quality(self, predicted_delay: float) -> str:
         """Determine prediction quality based on delay magnitude."""
@@ -107,7 +107,7 @@ class Flight(db.Model):
     __tablename__ = 'flights'
     
     id = db.Column(db.Integer, primary_key=True)
-    flight_number = db.Column(db.String(10), nullable=False, index=True)
+    flight_number = db.Column(db.String(10), nullable=False)  # Indexed via idx_flight_number_date
     airline_id = db.Column(db.Integer, db.ForeignKey('airlines.id'), nullable=False)
     aircraft_id = db.Column(db.Integer, db.ForeignKey('aircraft.id'), nullable=False)
     origin_airport_id = db.Column(db.Integer, db.ForeignKey('airports.id'), nullable=False)
@@ -180,62 +180,79 @@ class Flight(db.Model):
     __table_args__ = (
         Index('idx_flight_date_origin', 'flight_date', 'origin_airport_id'),
         Index('idx_flight_date_destination', 'flight_date', 'destination_airport_id'),
-        Index('idx_flight_route_date', 'origin_airport_id', 'destination_airport_id', 'flight_date'),
+        # Route/date lookups come back already ordered by departure time
+        Index('idx_flight_route_date_departure', 'origin_airport_id', 'destination_airport_id', 'flight_date', 'scheduled_departure'),
         Index('idx_status_date', 'status', 'flight_date'),
+        Index('idx_flight_airline', 'airline_id'),
+        Index('idx_flight_destination', 'destination_airport_id'),
+        Index('idx_flight_number_date', 'flight_number', 'flight_date'),
+        # Covers the delay-analysis route filter and its group by delay reason
+        Index('idx_flight_route_reason', 'origin_airport_id', 'destination_airport_id', 'primary_delay_reason'),
     )
 
     def to_dict(self):
+        return Flight.row_to_dict(
+            {column.key: getattr(self, column.key) for column in self.__table__.columns},
+            airline=self.airline.to_dict() if self.airline else None,
+            aircraft=self.aircraft.to_dict() if self.aircraft else None,
+            origin_airport=self.origin_airport.to_dict() if self.origin_airport else None,
+            destination_airport=self.destination_airport.to_dict() if self.destination_airport else None
+        )
+    
+    @staticmethod
+    def row_to_dict(row, airline=None, aircraft=None, origin_airport=None, destination_airport=None):
+        """Serialize a flights row mapping; related records are passed in already serialized"""
         return {
-            'id': self.id,
-            'flight_number': self.flight_number,
-            'airline': self.airline.to_dict() if self.airline else None,
-            'aircraft': self.aircraft.to_dict() if self.aircraft else None,
-            'origin_airport': self.origin_airport.to_dict() if self.origin_airport else None,
-            'destination_airport': self.destination_airport.to_dict() if self.destination_airport else None,
-            'scheduled_departure': self.scheduled_departure.isoformat() if self.scheduled_departure else None,
-            'actual_departure': self.actual_departure.isoformat() if self.actual_departure else None,
-            'scheduled_arrival': self.scheduled_arrival.isoformat() if self.scheduled_arrival else None,
-            'actual_arrival': self.actual_arrival.isoformat() if self.actual_arrival else None,
-            'gate': self.gate,
-            'terminal': self.terminal,
-            'status': self.status,
-            'delay_minutes': self.delay_minutes,
-            'delay_percentage': self.delay_percentage,
-            'cancellation_reason': self.cancellation_reason,
-            'seats_available': self.seats_available,
-            'total_seats': self.total_seats,
-            'load_factor': self.load_factor,
-            'on_time_probability': self.on_time_probability,
-            'delay_probability': self.delay_probability,
-            'cancellation_probability': self.cancellation_probability,
-            'base_price': self.base_price,
-            'current_price': self.current_price,
-            'currency': self.currency,
-            'flight_date': self.flight_date.isoformat() if self.flight_date else None,
-            'duration_minutes': self.duration_minutes,
-            'distance_miles': self.distance_miles,
-            'route_frequency': self.route_frequency,
+            'id': row['id'],
+            'flight_number': row['flight_number'],
+            'airline': airline,
+            'aircraft': aircraft,
+            'origin_airport': origin_airport,
+            'destination_airport': destination_airport,
+            'scheduled_departure': row['scheduled_departure'].isoformat() if row['scheduled_departure'] else None,
+            'actual_departure': row['actual_departure'].isoformat() if row['actual_departure'] else None,
+            'scheduled_arrival': row['scheduled_arrival'].isoformat() if row['scheduled_arrival'] else None,
+            'actual_arrival': row['actual_arrival'].isoformat() if row['actual_arrival'] else None,
+            'gate': row['gate'],
+            'terminal': row['terminal'],
+            'status': row['status'],
+            'delay_minutes': row['delay_minutes'],
+            'delay_percentage': row['delay_percentage'],
+            'cancellation_reason': row['cancellation_reason'],
+            'seats_available': row['seats_available'],
+            'total_seats': row['total_seats'],
+            'load_factor': row['load_factor'],
+            'on_time_probability': row['on_time_probability'],
+            'delay_probability': row['delay_probability'],
+            'cancellation_probability': row['cancellation_probability'],
+            'base_price': row['base_price'],
+            'current_price': row['current_price'],
+            'currency': row['currency'],
+            'flight_date': row['flight_date'].isoformat() if row['flight_date'] else None,
+            'duration_minutes': row['duration_minutes'],
+            'distance_miles': row['distance_miles'],
+            'route_frequency': row['route_frequency'],
             # NEW: Comprehensive delay metrics
-            'air_traffic_delay_minutes': self.air_traffic_delay_minutes,
-            'weather_delay_minutes': self.weather_delay_minutes,
-            'security_delay_minutes': self.security_delay_minutes,
-            'mechanical_delay_minutes': self.mechanical_delay_minutes,
-            'crew_delay_minutes': self.crew_delay_minutes,
+            'air_traffic_delay_minutes': row['air_traffic_delay_minutes'],
+            'weather_delay_minutes': row['weather_delay_minutes'],
+            'security_delay_minutes': row['security_delay_minutes'],
+            'mechanical_delay_minutes': row['mechanical_delay_minutes'],
+            'crew_delay_minutes': row['crew_delay_minutes'],
             # Historical performance metrics
-            'route_on_time_percentage': self.route_on_time_percentage,
-            'airline_on_time_percentage': self.airline_on_time_percentage,
-            'time_of_day_delay_factor': self.time_of_day_delay_factor,
-            'day_of_week_delay_factor': self.day_of_week_delay_factor,
-            'seasonal_delay_factor': self.seasonal_delay_factor,
+            'route_on_time_percentage': row['route_on_time_percentage'],
+            'airline_on_time_percentage': row['airline_on_time_percentage'],
+            'time_of_day_delay_factor': row['time_of_day_delay_factor'],
+            'day_of_week_delay_factor': row['day_of_week_delay_factor'],
+            'seasonal_delay_factor': row['seasonal_delay_factor'],
             # Real-time conditions
-            'current_weather_delay_risk': self.current_weather_delay_risk,
-            'current_air_traffic_delay_risk': self.current_air_traffic_delay_risk,
-            'current_airport_congestion_level': self.current_airport_congestion_level,
+            'current_weather_delay_risk': row['current_weather_delay_risk'],
+            'current_air_traffic_delay_risk': row['current_air_traffic_delay_risk'],
+            'current_airport_congestion_level': row['current_airport_congestion_level'],
             # Primary delay reason analysis
-            'primary_delay_reason': self.primary_delay_reason,
-            'primary_delay_reason_percentage': self.primary_delay_reason_percentage,
-            'secondary_delay_reason': self.secondary_delay_reason,
-            'delay_reason_confidence': self.delay_reason_confidence
+            'primary_delay_reason': row['primary_delay_reason'],
+            'primary_delay_reason_percentage': row['primary_delay_reason_percentage'],
+            'secondary_delay_reason': row['secondary_delay_reason'],
+            'delay_reason_confidence': row['delay_reason_confidence']
         }
 
 class FlightStatus(db.Model):
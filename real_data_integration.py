@@ -8,6 +8,8 @@ from various APIs and data sources.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+import atexit
 import json
 import os
 from datetime import datetime, timedelta, date
@@ -15,6 +17,13 @@ from typing import Dict, List, Optional, Tuple
 import time
 from dataclasses import dataclass
 
+# One pooled session for every weather and flight API call, so repeat requests to the
+# same host reuse keep-alive connections instead of paying a TCP/TLS handshake each time
+http_session = requests.Session()
+http_session.mount('http://', HTTPAdapter(pool_connections=8, pool_maxsize=32))
+http_session.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=32))
+atexit.register(http_session.close)
+
 @dataclass
 class WeatherData:
     """Weather data structure"""
@@ -71,7 +80,7 @@ class RealWeatherAPI:
                 'units': 'metric'
             }
             
-            response = requests.get(url, params=params, timeout=10)
+            response = http_session.get(url, params=params, timeout=10)
             response.raise_for_status()
             
             data = response.json()
@@ -202,7 +211,7 @@ class RealFlightDataAPI:
             }
             
             auth = (self.username, self.api_key)
-            response = requests.get(url, params=params, auth=auth, timeout=15)
+            response = http_session.get(url, params=params, auth=auth, timeout=15)
             response.raise_for_status()
             
             data = response.json()
@@ -302,7 +311,7 @@ class AviationStackAPI:
                 'flight_status': 'active'
             }
             
-            response = requests.get(url, params=params, timeout=15)
+            response = http_session.get(url, params=params, timeout=15)
             response.raise_for_status()
             
             data = response.json()
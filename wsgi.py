@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+"""
+WSGI Entry Point
+================
+
+Production entry point for the OnTime API, served by gunicorn with gevent workers:
+
+    gunicorn -k gevent -w 4 --worker-connections 1000 --bind 0.0.0.0:8000 wsgi:app
+"""
+
+# Patch sockets, threads and queues for gevent before anything else imports them
+from gevent import monkey
+monkey.patch_all()
+
+from app import app  # noqa: E402